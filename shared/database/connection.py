@@ -4,13 +4,102 @@ Gestión de conexiones a base de datos.
 Soporta múltiples tipos de BD: SQLite, PostgreSQL, MySQL, SQL Server.
 """
 
+import hashlib
+import re
 import sqlite3
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Sequence, Tuple
 import logging
 
+from shared.utils.exceptions import DatabaseError
+
 logger = logging.getLogger(__name__)
 
+try:
+    import mssql_python
+    HAS_MSSQL_PYTHON = True
+except ImportError:
+    HAS_MSSQL_PYTHON = False
+
+# Backends soportados para SQL Server
+_BACKENDS_SQLSERVER = ("mssql_python", "pyodbc")
+
+# Cadenas de conexión a SQL Server: plantillas fijas para que la cadena sea idéntica
+# byte a byte entre conexiones (los pools comparan la cadena completa)
+_CONN_TMPL_PYODBC = (
+    "DRIVER={{{driver}}};SERVER={server};DATABASE={database};"
+    "UID={user};PWD={password};TrustServerCertificate=yes;"
+    "Connection Timeout=15;Command Timeout=30;"
+)
+_CONN_TMPL_MSSQL = (
+    "SERVER={server};DATABASE={database};"
+    "UID={user};PWD={password};TrustServerCertificate=yes;"
+)
+# Timeout de login (segundos) de ambos backends; mssql_python lo recibe como atributo
+# ODBC SQL_ATTR_LOGIN_TIMEOUT, igual que pyodbc con su parámetro timeout
+_LOGIN_TIMEOUT = 15
+_SQL_ATTR_LOGIN_TIMEOUT = 103
+
+# Fallos recientes de conexión a SQL Server: clave de conexión -> (instante, error).
+# Solo se recuerdan los errores de _TIPOS_FALLO_CACHEABLES (servidor inalcanzable):
+# mientras no venza el TTL, connect() falla de inmediato en lugar de esperar otra
+# vez el timeout completo. La clave usa un hash de la contraseña, nunca el texto
+_FALLOS_RECIENTES: Dict[tuple, Tuple[float, str]] = {}
+_FALLOS_TTL = 30.0
+_TIPOS_FALLO_CACHEABLES = frozenset({"host", "timeout"})
+
+# Pool nativo de mssql_python (se configura una vez, antes de la primera conexión)
+_MSSQL_POOL_MAX_SIZE = 8
+_MSSQL_POOL_IDLE_TIMEOUT = 300
+_mssql_pooling_activo = False
+
+# Drivers ODBC preferidos para SQL Server, en orden de prioridad
+_DRIVERS_PREFERIDOS = ("ODBC Driver 17 for SQL Server", "ODBC Driver 18 for SQL Server")
+
+# Clasificación de errores de conexión a SQL Server en una sola pasada; si el mensaje
+# coincide con varios tipos, decide el orden de _PRIORIDAD_ERRORES
+_ERROR_SQLSERVER_RE = re.compile(
+    r"(?P<host>11001|Host desconocido|08001)|(?P<driver>IM002)"
+    r"|(?P<timeout>(?i:timeout))|(?P<auth>28000|Login failed)"
+)
+_PRIORIDAD_ERRORES = ("host", "driver", "timeout", "auth")
+
+# Módulo pyodbc importado bajo demanda (ver _importar_pyodbc)
+_pyodbc = None
+
+
+def _activar_pooling_mssql() -> None:
+    """Activa una sola vez el pool de conexiones nativo de mssql_python."""
+    global _mssql_pooling_activo
+    if not _mssql_pooling_activo:
+        mssql_python.pooling(max_size=_MSSQL_POOL_MAX_SIZE, idle_timeout=_MSSQL_POOL_IDLE_TIMEOUT)
+        _mssql_pooling_activo = True
+
+
+def _importar_pyodbc():
+    """
+    Importa pyodbc una sola vez y activa el pooling del driver manager ODBC.
+
+    pyodbc.pooling debe fijarse antes de la primera conexión del proceso. Con el
+    pooling activo, cerrar una conexión la devuelve al pool y la siguiente con la
+    misma cadena de conexión reutiliza el canal ya autenticado (sin repetir el
+    handshake TCP/TLS/LOGIN).
+
+    Returns:
+        Módulo pyodbc.
+
+    Raises:
+        ImportError: Si pyodbc no está instalado.
+    """
+    global _pyodbc
+    if _pyodbc is None:
+        import pyodbc
+        pyodbc.pooling = True
+        _pyodbc = pyodbc
+    return _pyodbc
+
 
 class DatabaseConnection(ABC):
     """Clase abstracta para conexiones de base de datos."""
@@ -231,43 +320,38 @@ class SQLServerConnection(DatabaseConnection):
     """
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_available_driver() -> str:
         """
         Detecta automáticamente qué driver ODBC está disponible.
         
+        El resultado se cachea por proceso: la enumeración de drivers ODBC solo
+        se hace en la primera conexión.
+        
         Returns:
             Nombre del driver disponible, o "ODBC Driver 17 for SQL Server" como fallback
         """
+        driver_17 = _DRIVERS_PREFERIDOS[0]
         try:
-            import pyodbc
-            available_drivers = pyodbc.drivers()
-            
-            # Intentar primero con Driver 17 (más común)
-            driver_17 = "ODBC Driver 17 for SQL Server"
-            driver_18 = "ODBC Driver 18 for SQL Server"
-            
-            if driver_17 in available_drivers:
-                logger.info(f"Driver detectado: {driver_17}")
-                return driver_17
-            elif driver_18 in available_drivers:
-                logger.info(f"Driver detectado: {driver_18}")
-                return driver_18
-            else:
-                # Buscar cualquier driver que contenga "SQL Server"
-                for driver in available_drivers:
-                    if "SQL Server" in driver:
-                        logger.info(f"Driver detectado: {driver}")
-                        return driver
-                
-                # Si no se encuentra ninguno, usar 17 como fallback
-                logger.warning(f"No se encontró ningún driver ODBC para SQL Server. Drivers disponibles: {available_drivers}")
-                logger.warning(f"Usando '{driver_17}' como fallback. Si falla, instala un driver ODBC para SQL Server.")
-                return driver_17
+            available_drivers = _importar_pyodbc().drivers()
         except ImportError:
             logger.warning("pyodbc no está disponible para detectar drivers. Usando 'ODBC Driver 17 for SQL Server' como fallback.")
-            return "ODBC Driver 17 for SQL Server"
+            return driver_17
+        
+        # Drivers preferidos primero (17 es el más común), luego cualquiera de SQL Server
+        sql_drivers = tuple(d for d in available_drivers if "SQL Server" in d)
+        for driver in _DRIVERS_PREFERIDOS + sql_drivers:
+            if driver in sql_drivers:
+                logger.info(f"Driver detectado: {driver}")
+                return driver
+        
+        # Si no se encuentra ninguno, usar 17 como fallback
+        logger.warning(f"No se encontró ningún driver ODBC para SQL Server. Drivers disponibles: {available_drivers}")
+        logger.warning(f"Usando '{driver_17}' como fallback. Si falla, instala un driver ODBC para SQL Server.")
+        return driver_17
     
-    def __init__(self, server: str, database: str, user: str, password: str, driver: Optional[str] = None, schema: Optional[str] = None):
+    def __init__(self, server: str, database: str, user: str, password: str, driver: Optional[str] = None, schema: Optional[str] = None,
+                 backend: Optional[str] = None):
         """
         Inicializa la conexión a SQL Server.
         
@@ -278,14 +362,20 @@ class SQLServerConnection(DatabaseConnection):
             password: Contraseña
             driver: Driver ODBC (default: None, detecta automáticamente el driver disponible)
             schema: Nombre del esquema (default: None, usa esquema por defecto)
+            backend: 'mssql_python' o 'pyodbc' (default: None, usa pyodbc). Con
+                'mssql_python' se usa su pool nativo de conexiones
             
         Note:
             Si encuentras errores de conexión relacionados con el driver ODBC,
             consulta shared/database/README_ODBC_SETUP.md para instrucciones
             de instalación y solución de problemas.
         """
-        # Si no se especifica driver, detectar automáticamente
-        if driver is None:
+        if backend is None:
+            backend = "pyodbc"
+        elif backend not in _BACKENDS_SQLSERVER:
+            raise ValueError(f"Backend de SQL Server no soportado: {backend}. Opciones: {_BACKENDS_SQLSERVER}")
+        # Si no se especifica driver, detectar automáticamente (solo pyodbc usa drivers ODBC)
+        if driver is None and backend == "pyodbc":
             driver = SQLServerConnection._get_available_driver()
         # Validar parámetros requeridos con logging detallado
         logger.info(f"SQLServerConnection.__init__ llamado con: server={server}, database={database}, user={user}, password={'***' if password else None}, driver={driver}, schema={schema}")
@@ -314,6 +404,7 @@ class SQLServerConnection(DatabaseConnection):
         self.password = str(password)  # Asegurar que sea string
         self.driver = driver
         self.schema = schema
+        self.backend = backend
         self.connection = None
         
         logger.info(f"SQLServerConnection inicializado correctamente: server={self.server}, database={self.database}, user={self.user}")
@@ -332,27 +423,89 @@ class SQLServerConnection(DatabaseConnection):
             return f"[{self.schema}].[{table}]"
         return f"[{table}]"
 
+    @staticmethod
+    def _clasificar_error(error_msg: str) -> Optional[str]:
+        """
+        Clasifica un error de conexión para elegir el mensaje de ayuda.
+        
+        Args:
+            error_msg: Mensaje de la excepción
+            
+        Returns:
+            'host', 'driver', 'timeout', 'auth' o None si no se reconoce
+        """
+        tipos = {m.lastgroup for m in _ERROR_SQLSERVER_RE.finditer(error_msg)}
+        return next((tipo for tipo in _PRIORIDAD_ERRORES if tipo in tipos), None)
+    
+    def _ayuda_error_host(self) -> None:
+        """Registra la ayuda para hostnames que no se pueden resolver."""
+        logger.error("SOLUCIÓN: El hostname no se puede resolver. Verifica:")
+        if self.server:
+            try:
+                server_host = self.server.split(',')[0] if ',' in str(self.server) else str(self.server)
+                logger.error(f"  1. Que el hostname sea correcto: {server_host}")
+            except (AttributeError, TypeError) as split_error:
+                logger.error(f"  1. Error al procesar server: {self.server} (tipo: {type(self.server)}). Error: {split_error}")
+        else:
+            logger.error("  1. Que la configuración de 'server' esté presente en la configuración de BD")
+        logger.error(f"  2. Que SQL Server esté corriendo en ese servidor")
+    
+    def _ayuda_error_driver(self) -> None:
+        """Registra la ayuda para drivers ODBC no encontrados."""
+        logger.error("SOLUCIÓN: El driver ODBC no se encuentra. Verifica:")
+        logger.error(f"  1. Que el driver '{self.driver}' esté instalado")
+        try:
+            available_drivers = _importar_pyodbc().drivers()
+            logger.error(f"  2. Drivers ODBC disponibles en el sistema: {available_drivers}")
+            logger.error("  3. Instala un driver ODBC para SQL Server desde:")
+            logger.error("     https://docs.microsoft.com/en-us/sql/connect/odbc/download-odbc-driver-for-sql-server")
+        except ImportError:
+            logger.error("  2. pyodbc no está disponible. Instala con: pip install pyodbc")
+    
+    def _ayuda_error_timeout(self) -> None:
+        """Registra la ayuda para timeouts de conexión."""
+        logger.error("SOLUCIÓN: Timeout de conexión. Verifica:")
+        logger.error(f"  1. Que SQL Server esté corriendo y accesible")
+        logger.error(f"  2. Que el puerto sea correcto: {self.server}")
+        logger.error("  3. Que el firewall permita conexiones")
+    
+    def _ayuda_error_auth(self) -> None:
+        """Registra la ayuda para errores de autenticación."""
+        logger.error("SOLUCIÓN: Error de autenticación. Verifica:")
+        logger.error(f"  1. Que el usuario '{self.user}' y la contraseña sean correctos")
+        logger.error("  2. Que SQL Server tenga habilitada la autenticación SQL")
+    
+    _AYUDAS_ERROR = {
+        "host": _ayuda_error_host,
+        "driver": _ayuda_error_driver,
+        "timeout": _ayuda_error_timeout,
+        "auth": _ayuda_error_auth,
+    }
+    
     def connect(self):
         """
         Establece la conexión a SQL Server.
+        
+        Raises:
+            DatabaseError: Si el servidor no respondió a esta misma conexión hace menos
+                de _FALLOS_TTL segundos
         """
+        clave_fallo = (
+            self.backend, self.driver, self.server, self.database, self.user,
+            hashlib.sha256(self.password.encode("utf-8")).hexdigest(),
+        )
+        fallo = _FALLOS_RECIENTES.get(clave_fallo)
+        if fallo is not None:
+            if time.monotonic() - fallo[0] < _FALLOS_TTL:
+                logger.error(f"Conexión a SQL Server omitida: falló hace menos de {_FALLOS_TTL:.0f}s ({fallo[1]})")
+                raise DatabaseError(f"Fallo reciente de conexión a SQL Server: {fallo[1]}")
+            _FALLOS_RECIENTES.pop(clave_fallo, None)
+        
         try:
-            import pyodbc
-            
-            # Construir connection string
-            connection_string = (
-                f"DRIVER={{{self.driver}}};"
-                f"SERVER={self.server};"
-                f"DATABASE={self.database};"
-                f"UID={self.user};"
-                f"PWD={self.password};"
-                f"TrustServerCertificate=yes;"
-                f"Connection Timeout=15;"
-                f"Command Timeout=30;"
-            )
-            
-            logger.info(f"Conectando a SQL Server: {self.server}/{self.database} con driver: {self.driver}")
-            self.connection = pyodbc.connect(connection_string, timeout=15, autocommit=False)
+            if self.backend == "mssql_python":
+                self.connection = self._conectar_mssql_python()
+            else:
+                self.connection = self._conectar_pyodbc()
             
             if hasattr(self.connection, 'autocommit'):
                 self.connection.autocommit = False
@@ -365,45 +518,50 @@ class SQLServerConnection(DatabaseConnection):
             return self.connection
             
         except ImportError:
-            logger.error("pyodbc no está instalado. Instala con: pip install pyodbc")
+            paquete = self.backend.replace("_", "-")
+            logger.error(f"{self.backend} no está instalado. Instala con: pip install {paquete}")
             raise
         except Exception as e:
             error_msg = str(e)
+            tipo_error = self._clasificar_error(error_msg)
+            if tipo_error in _TIPOS_FALLO_CACHEABLES:
+                _FALLOS_RECIENTES[clave_fallo] = (time.monotonic(), error_msg[:200])
             logger.error(f"Error al conectar a SQL Server: {error_msg}")
             logger.error(f"SERVER={self.server}, DATABASE={self.database}, DRIVER={self.driver}")
             logger.error(f"Tipo de error: {type(e).__name__}")
             
             # Mensajes de ayuda según el tipo de error
-            if "11001" in error_msg or "Host desconocido" in error_msg or "08001" in error_msg:
-                logger.error("SOLUCIÓN: El hostname no se puede resolver. Verifica:")
-                if self.server:
-                    try:
-                        server_host = self.server.split(',')[0] if ',' in str(self.server) else str(self.server)
-                        logger.error(f"  1. Que el hostname sea correcto: {server_host}")
-                    except (AttributeError, TypeError) as split_error:
-                        logger.error(f"  1. Error al procesar server: {self.server} (tipo: {type(self.server)}). Error: {split_error}")
-                else:
-                    logger.error("  1. Que la configuración de 'server' esté presente en la configuración de BD")
-                logger.error(f"  2. Que SQL Server esté corriendo en ese servidor")
-            elif "IM002" in error_msg:
-                logger.error("SOLUCIÓN: El driver ODBC no se encuentra. Verifica:")
-                logger.error(f"  1. Que el driver '{self.driver}' esté instalado")
-                try:
-                    import pyodbc
-                    available_drivers = pyodbc.drivers()
-                    logger.error(f"  2. Drivers ODBC disponibles en el sistema: {available_drivers}")
-                    logger.error("  3. Instala un driver ODBC para SQL Server desde:")
-                    logger.error("     https://docs.microsoft.com/en-us/sql/connect/odbc/download-odbc-driver-for-sql-server")
-                except ImportError:
-                    logger.error("  2. pyodbc no está disponible. Instala con: pip install pyodbc")
-            elif "timeout" in error_msg.lower():
-                logger.error("SOLUCIÓN: Timeout de conexión. Verifica:")
-                logger.error(f"  1. Que SQL Server esté corriendo y accesible")
-                logger.error(f"  2. Que el puerto sea correcto: {self.server}")
-                logger.error("  3. Que el firewall permita conexiones")
+            ayuda = self._AYUDAS_ERROR.get(tipo_error)
+            if ayuda:
+                ayuda(self)
             
             raise
     
+    def _conectar_mssql_python(self):
+        """Abre la conexión con mssql_python usando su pool nativo."""
+        _activar_pooling_mssql()
+        connection_string = _CONN_TMPL_MSSQL.format(
+            server=self.server, database=self.database, user=self.user, password=self.password
+        )
+        logger.info(f"Conectando a SQL Server: {self.server}/{self.database} con mssql_python")
+        return mssql_python.connect(
+            connection_string, autocommit=False,
+            attrs_before={_SQL_ATTR_LOGIN_TIMEOUT: _LOGIN_TIMEOUT},
+        )
+    
+    def _conectar_pyodbc(self):
+        """Abre la conexión con pyodbc (pool del driver manager ODBC)."""
+        pyodbc = _importar_pyodbc()
+        
+        # Construir connection string
+        connection_string = _CONN_TMPL_PYODBC.format(
+            driver=self.driver, server=self.server, database=self.database,
+            user=self.user, password=self.password,
+        )
+        
+        logger.info(f"Conectando a SQL Server: {self.server}/{self.database} con driver: {self.driver}")
+        return pyodbc.connect(connection_string, timeout=_LOGIN_TIMEOUT, autocommit=False)
+    
     def disconnect(self) -> None:
         """Cierra la conexión a SQL Server."""
         if self.connection:
@@ -418,6 +576,28 @@ class SQLServerConnection(DatabaseConnection):
         cursor.execute(query, params or ())
         return cursor
     
+    def executemany(self, query: str, params_seq: Sequence[tuple]):
+        """
+        Ejecuta una consulta SQL para cada tupla de parámetros.
+        
+        Con pyodbc usa fast_executemany: los parámetros se envían en bloques
+        (arrays de parámetros ODBC) en lugar de un viaje al servidor por fila.
+        
+        Args:
+            query: Consulta SQL parametrizada
+            params_seq: Secuencia de tuplas de parámetros
+            
+        Returns:
+            Cursor utilizado
+        """
+        if not self.connection:
+            self.connect()
+        cursor = self.connection.cursor()
+        if self.backend == "pyodbc":
+            cursor.fast_executemany = True
+        cursor.executemany(query, params_seq)
+        return cursor
+    
     def commit(self) -> None:
         """Confirma una transacción."""
         if self.connection:
@@ -551,6 +731,7 @@ def create_connection(db_type: str, **kwargs) -> DatabaseConnection:
                 password=password,
                 driver=kwargs.get("driver"),  # None = detección automática
                 schema=schema,
+                backend=kwargs.get("backend"),  # None = pyodbc
             )
             logger.info("SQLServerConnection creado exitosamente")
             return connection
@@ -4,14 +4,33 @@ Cliente base para Microsoft Graph API.
 Maneja autenticación y operaciones base con la API.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from msal import ConfidentialClientApplication
 import requests
+import time
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    import json
+    from json import loads as _json_loads
+
+    def _json_dumps(data: Any) -> bytes:
+        """Serializa a JSON en bytes (respaldo con la librería estándar)."""
+        return json.dumps(data).encode("utf-8")
 
 from shared.utils.logger import get_logger
 
 logger = get_logger("GraphApiClient")
 
+# Máximo de sub-peticiones admitidas por Graph en un único /$batch
+MAX_BATCH_SIZE = 20
+# Tamaño máximo del cuerpo de un /$batch (Graph rechaza peticiones de más de ~4 MB)
+MAX_BATCH_BYTES = 3 * 1024 * 1024
+
+# Bloques de carga para createUploadSession (Graph exige múltiplos de 320 KiB)
+UPLOAD_CHUNK_SIZE = 12 * 320 * 1024
+
 
 class GraphApiClient:
     """
@@ -120,16 +139,18 @@ class GraphApiClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         binary: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> Any:
         """
         Realiza una petición a Graph API.
 
         Args:
             method: Método HTTP ('GET', 'POST', etc.)
-            endpoint: Endpoint de la API (sin incluir la base URL)
+            endpoint: Endpoint de la API (sin incluir la base URL) o URL absoluta
             params: Parámetros de query string
             json_data: Datos para enviar en el body
             binary: Si es True, retorna el contenido binario
+            headers: Headers adicionales (ej: ConsistencyLevel para $search)
 
         Returns:
             Dict o bytes: Respuesta de la API
@@ -137,21 +158,190 @@ class GraphApiClient:
         Raises:
             requests.RequestException: Si hay error en la petición
         """
-        headers = {"Authorization": f"Bearer {self.get_token()}"}
+        request_headers = {"Authorization": f"Bearer {self.get_token()}"}
 
         if not binary:
-            headers["Content-Type"] = "application/json"
+            request_headers["Content-Type"] = "application/json"
+        if headers:
+            request_headers.update(headers)
+
+        # Las URLs absolutas (ej: @odata.nextLink) se usan tal cual
+        if endpoint.startswith("https://"):
+            url = endpoint
+        else:
+            url = f"{self.graph_api_endpoint}/users/{self.user_email}/{endpoint}"
 
-        url = f"{self.graph_api_endpoint}/users/{self.user_email}/{endpoint}"
+        body = None
+        if json_data is not None:
+            body = _json_dumps(json_data)
+            request_headers.setdefault("Content-Type", "application/json")
 
         response = requests.request(
-            method=method, url=url, headers=headers, params=params, json=json_data
+            method=method, url=url, headers=request_headers, params=params, data=body
         )
         response.raise_for_status()
 
         if binary:
             return response.content
-        return response.json() if response.content else {}
+        return _json_loads(response.content) if response.content else {}
+
+    def batch_request(
+        self, batch_items: List[Dict[str, Any]], max_retries: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Ejecuta varias peticiones agrupadas mediante el endpoint /$batch de Graph API.
+        Las peticiones se envían en bloques de hasta MAX_BATCH_SIZE sub-peticiones
+        y MAX_BATCH_BYTES de cuerpo serializado. Las sub-peticiones
+        limitadas (429/503) se reintentan respetando su Retry-After.
+
+        Args:
+            batch_items: Lista de sub-peticiones con formato:
+                {
+                    "method": str,
+                    "endpoint": str (relativo al usuario, igual que en make_request),
+                    "body": dict (opcional),
+                    "headers": dict (opcional)
+                }
+            max_retries: Reintentos máximos para sub-peticiones limitadas
+
+        Returns:
+            Lista de respuestas {"id", "status", "headers", "body"} en el mismo
+            orden que batch_items
+
+        Raises:
+            requests.RequestException: Si falla la petición /$batch completa
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch_items)
+        sizes = [
+            len(_json_dumps(item.get("body"))) + len(item["endpoint"])
+            for item in batch_items
+        ]
+        pending = list(range(len(batch_items)))
+        attempt = 0
+        while pending:
+            retry, wait_seconds = [], 0.0
+            for indexes in self._batch_chunks(pending, sizes):
+                by_id = self._send_batch(batch_items, indexes)
+                for index in indexes:
+                    response = by_id.get(
+                        str(index), {"id": str(index), "status": 0, "body": {}}
+                    )
+                    if response.get("status") in (429, 503) and attempt < max_retries:
+                        retry.append(index)
+                        wait_seconds = max(wait_seconds, self._retry_after(response))
+                    else:
+                        results[index] = response
+            if retry:
+                logger.warning(
+                    f"{len(retry)} sub-peticiones limitadas, reintentando en {wait_seconds}s"
+                )
+                time.sleep(wait_seconds)
+            pending = retry
+            attempt += 1
+        return results
+
+    def _batch_chunks(self, indexes: List[int], sizes: List[int]) -> List[List[int]]:
+        """
+        Agrupa los índices en bloques de hasta MAX_BATCH_SIZE sub-peticiones cuyo
+        tamaño serializado sume como máximo MAX_BATCH_BYTES. Una sub-petición que
+        por sí sola excede el límite va en un bloque propio.
+        """
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        current_size = 0
+        for index in indexes:
+            if current and (
+                len(current) >= MAX_BATCH_SIZE
+                or current_size + sizes[index] > MAX_BATCH_BYTES
+            ):
+                chunks.append(current)
+                current, current_size = [], 0
+            current.append(index)
+            current_size += sizes[index]
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _send_batch(
+        self, batch_items: List[Dict[str, Any]], indexes: List[int]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Envía un único /$batch con las sub-peticiones indicadas y retorna las respuestas por ID."""
+        headers = {
+            "Authorization": f"Bearer {self.get_token()}",
+            "Content-Type": "application/json",
+        }
+        sub_requests = []
+        for index in indexes:
+            item = batch_items[index]
+            sub_request = {
+                "id": str(index),
+                "method": item["method"],
+                "url": f"/users/{self.user_email}/{item['endpoint']}",
+            }
+            sub_headers = dict(item.get("headers") or {})
+            if item.get("body") is not None:
+                sub_request["body"] = item["body"]
+                sub_headers.setdefault("Content-Type", "application/json")
+            if sub_headers:
+                sub_request["headers"] = sub_headers
+            sub_requests.append(sub_request)
+
+        response = requests.request(
+            method="POST",
+            url=f"{self.graph_api_endpoint}/$batch",
+            headers=headers,
+            data=_json_dumps({"requests": sub_requests}),
+        )
+        response.raise_for_status()
+        return {
+            r.get("id"): r for r in _json_loads(response.content).get("responses", [])
+        }
+
+    def _retry_after(self, response: Dict[str, Any]) -> float:
+        """Obtiene los segundos de espera del header Retry-After de una sub-respuesta."""
+        headers = response.get("headers") or {}
+        value = headers.get("Retry-After") or headers.get("retry-after")
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 1.0
+
+    def upload_in_chunks(
+        self, upload_url: str, content: Any, chunk_size: int = UPLOAD_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Sube un contenido a una sesión de carga de Graph API (createUploadSession)
+        mediante PUT por bloques con Content-Range.
+
+        Args:
+            upload_url: URL de la sesión (pre-autenticada, no lleva Authorization)
+            content: Contenido binario (bytes, bytearray o memoryview)
+            chunk_size: Tamaño de cada bloque (múltiplo de 320 KiB)
+
+        Returns:
+            Respuesta del último bloque
+
+        Raises:
+            requests.RequestException: Si falla la carga de algún bloque
+        """
+        data = memoryview(content)
+        total = len(data)
+        response = None
+        for start in range(0, total, chunk_size):
+            chunk = data[start:start + chunk_size]
+            end = start + len(chunk) - 1
+            response = requests.put(
+                upload_url,
+                headers={
+                    "Content-Length": str(len(chunk)),
+                    "Content-Range": f"bytes {start}-{end}/{total}",
+                },
+                data=chunk.tobytes(),
+            )
+            response.raise_for_status()
+        if response is None or not response.content:
+            return {}
+        return _json_loads(response.content)
 
     def test_connection(self) -> bool:
         """
@@ -4,9 +4,12 @@ Lector de correos electrónicos usando Microsoft Graph API.
 Permite leer correos, obtener adjuntos y gestionar estado de correos.
 """
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Iterator, Sequence
 from datetime import datetime
+from itertools import islice
+from urllib.parse import urlencode, quote
 import unicodedata
+import warnings
 import re
 
 from .graph_api_client import GraphApiClient
@@ -14,6 +17,25 @@ from shared.utils.logger import get_logger
 
 logger = get_logger("GraphEmailReader")
 
+# Límites para evitar URLs demasiado largas (414 / MaxQueryString)
+_MAX_ADDRESSES_PER_FILTER = 15
+_MAX_FILTER_LENGTH = 1800
+
+# Tamaño de página al recorrer mensajes con @odata.nextLink
+_PAGE_SIZE = 50
+
+_SUBJECT_CLEAN_RE = re.compile(r"[^A-Za-z0-9_\-]")
+# IDs de Graph: base64-url de ~120 caracteres
+_GRAPH_ID_RE = re.compile(r"[A-Za-z0-9_\-=+/]{60,}")
+_WELL_KNOWN_FOLDERS = frozenset(
+    {"inbox", "drafts", "sentitems", "deleteditems", "junkemail", "outbox"}
+)
+
+
+def _odata_escape(value: str) -> str:
+    """Escapa un literal para OData (comilla simple duplicada)."""
+    return value.replace("'", "''")
+
 
 class EmailReaderError(Exception):
     """Excepción para errores del lector de correos."""
@@ -34,19 +56,26 @@ class GraphEmailReader:
         Inicializa el lector de correos con la configuración proporcionada.
 
         Args:
-            config: Diccionario de configuración con credenciales de Graph API
+            config: Diccionario de configuración con credenciales de Graph API.
+                Puede incluir "use_search" (default: False) para filtrar el asunto
+                con $search (índice del buzón) en lugar de contains(). Ojo: $search
+                busca por palabras/prefijos, no subcadenas, y solo se usa cuando
+                no hay otros filtros.
         """
         self.graph_client = GraphApiClient(config)
+        email_config = config.get("email", config)
+        self.use_search = email_config.get("use_search", False)
+        # Caché nombre de carpeta -> ID para evitar listar mailFolders en cada llamada
+        self._folder_id_cache: Dict[str, str] = {}
 
     def _looks_like_id(self, folder: str) -> bool:
         """Heurística simple para detectar si el parámetro parece un ID."""
-        return bool(folder) and len(folder) > 30 and ("-" in folder or folder.isalnum())
+        return bool(_GRAPH_ID_RE.fullmatch(folder or ""))
 
     def _normalize_well_known(self, folder: str) -> Optional[str]:
         """Devuelve el nombre normalizado si es una well-known folder, None en caso contrario."""
-        well_known = {"inbox", "drafts", "sentitems", "deleteditems", "junkemail", "outbox"}
         key = folder.lower().replace(" ", "") if folder else ""
-        return key if key in well_known else None
+        return key if key in _WELL_KNOWN_FOLDERS else None
 
     def _find_folder_id_by_name(self, folder: str) -> str:
         """Busca el ID de una carpeta por su nombre en raíz y en hijas."""
@@ -81,7 +110,12 @@ class GraphEmailReader:
             wk = self._normalize_well_known(folder)
             if wk:
                 return wk
-            return self._find_folder_id_by_name(folder)
+            key = folder.lower()
+            folder_id = self._folder_id_cache.get(key)
+            if folder_id is None:
+                folder_id = self._find_folder_id_by_name(folder)
+                self._folder_id_cache[key] = folder_id
+            return folder_id
         except EmailReaderError:
             raise
         except Exception as e:
@@ -96,39 +130,68 @@ class GraphEmailReader:
         """Formatea un filtro de dirección de correo."""
         addr_list = [addresses] if isinstance(addresses, str) else addresses
         return " or ".join(
-            [f"from/emailAddress/address eq '{addr}'" for addr in addr_list]
+            [
+                f"from/emailAddress/address eq '{_odata_escape(addr)}'"
+                for addr in addr_list
+            ]
         )
 
     def _format_subject_filter(self, subject_contains: str) -> str:
         """Formatea un filtro de asunto."""
-        return f"contains(subject, '{subject_contains}')"
+        return f"contains(subject, '{_odata_escape(subject_contains)}')"
 
-    def _build_filter_query(self, filter_criteria: Dict[str, Any]) -> str:
-        """Construye una consulta de filtro para Graph API."""
-        filters = []
-        if filter_criteria.get("from"):
-            from_filter = self._format_address_filter(filter_criteria["from"])
-            filters.append(f"({from_filter})")
-        if filter_criteria.get("subject_contains"):
-            subject_filter = self._format_subject_filter(
-                filter_criteria["subject_contains"]
-            )
-            filters.append(f"({subject_filter})")
-        if filter_criteria.get("has_attachments"):
-            filters.append("hasAttachments eq true")
+    def _format_subject_search(self, subject_contains: str) -> str:
+        """Formatea una búsqueda de asunto para $search (usa el índice del buzón)."""
+        term = subject_contains.replace("\\", "").replace('"', "")
+        return f'"subject:{term}"'
+
+    def _build_filter_query(
+        self,
+        filter_criteria: Dict[str, Any],
+        include_subject: bool = True,
+        read_status: str = "all",
+    ) -> str:
+        """
+        Construye una consulta de filtro para Graph API.
+        Los campos indexados (fecha, isRead, hasAttachments, from) van primero
+        y el contains() del asunto al final, para que el servidor aplique el
+        predicado selectivo antes del escaneo.
+
+        Args:
+            filter_criteria: Criterios de filtrado
+            include_subject: Si es False, omite el filtro contains() del asunto
+                (cuando el asunto se resuelve con $search)
+            read_status: Estado de lectura ("read", "unread", "all")
+        """
+        indexed_clauses = []
+        scan_clauses = []
         if filter_criteria.get("received_after"):
-            filters.append(
+            indexed_clauses.append(
                 self._format_date_filter(
                     "receivedDateTime ge", filter_criteria["received_after"]
                 )
             )
         if filter_criteria.get("received_before"):
-            filters.append(
+            indexed_clauses.append(
                 self._format_date_filter(
                     "receivedDateTime le", filter_criteria["received_before"]
                 )
             )
-        return " and ".join(filters)
+        if read_status == "unread":
+            indexed_clauses.append("isRead eq false")
+        elif read_status == "read":
+            indexed_clauses.append("isRead eq true")
+        if filter_criteria.get("has_attachments"):
+            indexed_clauses.append("hasAttachments eq true")
+        if filter_criteria.get("from"):
+            from_filter = self._format_address_filter(filter_criteria["from"])
+            indexed_clauses.append(f"({from_filter})")
+        if include_subject and filter_criteria.get("subject_contains"):
+            subject_filter = self._format_subject_filter(
+                filter_criteria["subject_contains"]
+            )
+            scan_clauses.append(f"({subject_filter})")
+        return " and ".join(indexed_clauses + scan_clauses)
 
     def get_emails(
         self,
@@ -149,6 +212,36 @@ class GraphEmailReader:
         Returns:
             Lista de diccionarios con información de correos
 
+        Raises:
+            EmailReaderError: Si hay error al obtener correos
+        """
+        emails = self.iter_emails(folder, filter_criteria, max_results, read_status)
+        # Valores inválidos de max_results los rechaza iter_emails
+        if isinstance(max_results, int) and max_results > 0:
+            emails = islice(emails, max_results)
+        return list(emails)
+
+    def iter_emails(
+        self,
+        folder: str = "inbox",
+        filter_criteria: Optional[Dict[str, Any]] = None,
+        max_results: Optional[int] = None,
+        read_status: str = "all",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Itera los correos de una carpeta siguiendo @odata.nextLink.
+        Las páginas se piden de _PAGE_SIZE correos y se procesan a medida que
+        llegan, sin cargar toda la carpeta en memoria.
+
+        Args:
+            folder: Nombre de la carpeta (default: "inbox")
+            filter_criteria: Criterios de filtrado opcionales
+            max_results: Número máximo de correos esperado (ajusta el tamaño de página)
+            read_status: Estado de lectura ("read", "unread", "all")
+
+        Yields:
+            Diccionarios con información de cada correo
+
         Raises:
             EmailReaderError: Si hay error al obtener correos
         """
@@ -159,58 +252,159 @@ class GraphEmailReader:
             # Resolver nombre de carpeta a ID
             folder_id = self._resolve_folder_id(folder)
 
+            criteria_chunks = self._split_address_criteria(filter_criteria)
+            if criteria_chunks:
+                emails_data = self._get_emails_batched(
+                    folder_id, criteria_chunks, max_results, read_status
+                )
+                for email in emails_data:
+                    yield self._process_email(email)
+                return
+
             params = self._build_request_params(
                 filter_criteria, max_results, read_status
             )
-            response = self.graph_client.make_request(
-                "GET", f"mailFolders/{folder_id}/messages", params=params
-            )
-            if not response:
-                raise EmailReaderError("No se pudo obtener respuesta del servidor")
-            emails_data = response.get("value", [])
-            return self._process_email_list(emails_data)
+            # $search requiere ConsistencyLevel: eventual
+            headers = {"ConsistencyLevel": "eventual"} if "$search" in params else None
+            endpoint = f"mailFolders/{folder_id}/messages"
+            while endpoint:
+                response = self.graph_client.make_request(
+                    "GET", endpoint, params=params, headers=headers
+                )
+                if not response:
+                    raise EmailReaderError("No se pudo obtener respuesta del servidor")
+                for email in response.get("value", []):
+                    yield self._process_email(email)
+                # nextLink es una URL absoluta que ya incluye los parámetros
+                endpoint = response.get("@odata.nextLink")
+                params = None
         except Exception as e:
             logger.error(f"Error obteniendo correos: {str(e)}")
             raise EmailReaderError(f"Error al obtener correos: {str(e)}")
 
+    def _split_address_criteria(
+        self, filter_criteria: Optional[Dict[str, Any]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Divide los criterios en bloques de remitentes cuando el filtro "from"
+        excede _MAX_ADDRESSES_PER_FILTER o la longitud de _MAX_FILTER_LENGTH.
+
+        Returns:
+            Lista de criterios (uno por bloque) o None si no es necesario dividir
+        """
+        addresses = filter_criteria.get("from") if filter_criteria else None
+        if not addresses or isinstance(addresses, str):
+            return None
+        if (
+            len(addresses) <= _MAX_ADDRESSES_PER_FILTER
+            and len(self._build_filter_query(filter_criteria)) <= _MAX_FILTER_LENGTH
+        ):
+            return None
+        return [
+            {**filter_criteria, "from": addresses[i:i + _MAX_ADDRESSES_PER_FILTER]}
+            for i in range(0, len(addresses), _MAX_ADDRESSES_PER_FILTER)
+        ]
+
+    def _get_emails_batched(
+        self,
+        folder_id: str,
+        criteria_chunks: List[Dict[str, Any]],
+        max_results: Optional[int],
+        read_status: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Consulta cada bloque de criterios en un único /$batch y combina los
+        resultados en el cliente (sin duplicados, más recientes primero).
+        Sin max_results, las páginas siguientes de cada bloque se recorren con
+        su @odata.nextLink.
+        """
+        batch_items = []
+        for criteria in criteria_chunks:
+            params = self._build_request_params(
+                criteria, max_results, read_status, page_size=max_results or _PAGE_SIZE
+            )
+            item = {
+                "method": "GET",
+                "endpoint": f"mailFolders/{folder_id}/messages?"
+                + urlencode(params, safe="$,'()/:", quote_via=quote),
+            }
+            if "$search" in params:
+                item["headers"] = {"ConsistencyLevel": "eventual"}
+            batch_items.append(item)
+
+        emails_by_id: Dict[str, Dict[str, Any]] = {}
+        responses = self.graph_client.batch_request(batch_items)
+        for item, response in zip(batch_items, responses):
+            status = response.get("status", 0)
+            if not 200 <= status < 300:
+                raise EmailReaderError(
+                    f"Error en consulta agrupada (status {status}): {response.get('body')}"
+                )
+            page = response.get("body") or {}
+            while True:
+                for email in page.get("value", []):
+                    emails_by_id.setdefault(email["id"], email)
+                # Con max_results, $top ya trae suficientes correos de cada bloque
+                next_link = None if max_results else page.get("@odata.nextLink")
+                if not next_link:
+                    break
+                page = self.graph_client.make_request(
+                    "GET", next_link, headers=item.get("headers")
+                )
+                if not page:
+                    raise EmailReaderError("No se pudo obtener respuesta del servidor")
+
+        emails_data = sorted(
+            emails_by_id.values(),
+            key=lambda e: e.get("receivedDateTime") or "",
+            reverse=True,
+        )
+        return emails_data[:max_results] if max_results else emails_data
+
     def _build_request_params(
         self,
         filter_criteria: Optional[Dict[str, Any]],
         max_results: Optional[int],
         read_status: str = "all",
+        page_size: int = _PAGE_SIZE,
     ) -> Dict[str, str]:
-        """Construye parámetros de la petición a Graph API."""
+        """
+        Construye parámetros de la petición a Graph API.
+
+        El filtro de asunto se envía como $search cuando use_search está activo y
+        no hay otros filtros, ya que Graph no admite combinar $search con $filter
+        en mensajes. En ese caso se mantiene contains() como respaldo.
+        """
         params = {
             "$select": "id,subject,from,toRecipients,receivedDateTime,body,isRead,hasAttachments"
         }
-        filters = []
-        if read_status == "unread":
-            filters.append("isRead eq false")
-        elif read_status == "read":
-            filters.append("isRead eq true")
-        if filter_criteria:
-            custom_filter = self._build_filter_query(filter_criteria)
-            if custom_filter:
-                filters.append(custom_filter)
-        if filters:
-            params["$filter"] = " and ".join(filters)
+        filter_criteria = filter_criteria or {}
+        subject = filter_criteria.get("subject_contains")
+        query = self._build_filter_query(
+            filter_criteria,
+            include_subject=not self.use_search,
+            read_status=read_status,
+        )
+        if subject and self.use_search:
+            if query:
+                query += f" and ({self._format_subject_filter(subject)})"
+            else:
+                params["$search"] = self._format_subject_search(subject)
+        if query:
+            params["$filter"] = query
         if max_results:
             if not isinstance(max_results, int) or max_results <= 0:
                 raise ValueError("max_results debe ser un entero positivo")
-            params["$top"] = str(max_results)
+            page_size = min(max_results, page_size)
+        params["$top"] = str(page_size)
         return params
 
-    def _process_email_list(
-        self, emails_data: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Procesa la lista de correos obtenidos de Graph API."""
-        result = []
-        for email in emails_data:
-            attachments = []
-            if email.get("hasAttachments"):
-                attachments = self._get_email_attachments(email["id"])
-            result.append(self._format_email_data(email, attachments))
-        return result
+    def _process_email(self, email: Dict[str, Any]) -> Dict[str, Any]:
+        """Procesa un correo obtenido de Graph API (incluye sus adjuntos)."""
+        attachments = []
+        if email.get("hasAttachments"):
+            attachments = self._get_email_attachments(email["id"])
+        return self._format_email_data(email, attachments)
 
     def _get_email_attachments(self, email_id: str) -> List[Dict[str, Any]]:
         """Obtiene los adjuntos de un correo."""
@@ -248,22 +442,25 @@ class GraphEmailReader:
         self, email: Dict[str, Any], attachments: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Formatea los datos de un correo en un diccionario estandarizado."""
-        destinatarios = []
-        if email.get("toRecipients"):
-            for recipient in email["toRecipients"]:
-                if recipient.get("emailAddress", {}).get("address"):
-                    destinatarios.append(recipient["emailAddress"]["address"])
+        destinatarios = [
+            recipient["emailAddress"]["address"]
+            for recipient in email.get("toRecipients") or []
+            if (recipient.get("emailAddress") or {}).get("address")
+        ]
+        from_address = (email.get("from") or {}).get("emailAddress") or {}
+        body = email.get("body") or {}
+        received = email.get("receivedDateTime")
+        # Se mantiene naive (sin tz) para ser comparable con datetime.now()
+        received_date = (
+            datetime.fromisoformat(received.rstrip("Z")) if received else datetime.now()
+        )
         return {
             "id": email["id"],
             "subject": email.get("subject", ""),
-            "from": email.get("from", {}).get("emailAddress", {}).get("address", ""),
+            "from": from_address.get("address", ""),
             "to": destinatarios,
-            "received_date": (
-                datetime.fromisoformat(email["receivedDateTime"].rstrip("Z"))
-                if email.get("receivedDateTime")
-                else datetime.now()
-            ),
-            "body": email.get("body", {}).get("content", ""),
+            "received_date": received_date,
+            "body": body.get("content", ""),
             "is_read": email.get("isRead", False),
             "has_attachments": email.get("hasAttachments", False),
             "attachments": attachments,
@@ -335,10 +532,82 @@ class GraphEmailReader:
             logger.error(f"Error marcando correo como leído: {e}")
             raise EmailReaderError(f"Error al marcar correo: {str(e)}")
 
+    def mark_as_read_many(self, email_ids: Sequence[str]) -> Dict[str, bool]:
+        """
+        Marca varios correos como leídos agrupando los PATCH en /$batch
+        (hasta 20 por petición).
+
+        Args:
+            email_ids: IDs de los correos
+
+        Returns:
+            Diccionario email_id -> True si se marcó exitosamente
+
+        Raises:
+            EmailReaderError: Si falla la petición agrupada
+        """
+        try:
+            batch_items = [
+                {"method": "PATCH", "endpoint": f"messages/{email_id}", "body": {"isRead": True}}
+                for email_id in email_ids
+            ]
+            responses = self.graph_client.batch_request(batch_items)
+            return {
+                email_id: 200 <= response.get("status", 0) < 300
+                for email_id, response in zip(email_ids, responses)
+            }
+        except Exception as e:
+            logger.error(f"Error marcando correos como leídos: {e}")
+            raise EmailReaderError(f"Error al marcar correos: {str(e)}")
+
+    def move_many(
+        self, email_ids: Sequence[str], destination_folder: str
+    ) -> Dict[str, Optional[str]]:
+        """
+        Mueve varios correos a una carpeta agrupando los POST en /$batch
+        (hasta 20 por petición).
+
+        Args:
+            email_ids: IDs de los correos a mover
+            destination_folder: Nombre o ID de la carpeta destino
+
+        Returns:
+            Diccionario email_id -> nuevo ID del correo movido (None si falló)
+        """
+        try:
+            folder_id = self._resolve_folder_id(destination_folder)
+            batch_items = [
+                {
+                    "method": "POST",
+                    "endpoint": f"messages/{email_id}/move",
+                    "body": {"destinationId": folder_id},
+                }
+                for email_id in email_ids
+            ]
+            responses = self.graph_client.batch_request(batch_items)
+        except Exception as e:
+            logger.error(f"Error moviendo correos a '{destination_folder}': {e}")
+            return {email_id: None for email_id in email_ids}
+
+        result = {}
+        for email_id, response in zip(email_ids, responses):
+            if 200 <= response.get("status", 0) < 300:
+                result[email_id] = (response.get("body") or {}).get("id") or email_id
+            else:
+                logger.error(
+                    f"Error moviendo correo {email_id}: status {response.get('status')}"
+                )
+                result[email_id] = None
+        moved = sum(1 for new_id in result.values() if new_id)
+        logger.info(f"{moved}/{len(result)} correos movidos a '{destination_folder}'")
+        return result
+
     def move_to_folder(self, email_id: str, folder: str) -> str:
         """
         Mueve un correo a una carpeta y retorna el nuevo ID del correo movido.
 
+        Obsoleto: usar move_email, que retorna el nuevo ID (o None si falla).
+
         Args:
             email_id: ID del correo
             folder: Nombre de la carpeta destino
@@ -346,29 +615,12 @@ class GraphEmailReader:
         Returns:
             Nuevo ID del correo movido (o ID original si falla)
         """
-        try:
-            folders_data = self.graph_client.make_request("GET", "mailFolders")
-            folder_id = None
-            for f in folders_data.get("value", []):
-                if f["displayName"].lower() == folder.lower():
-                    folder_id = f["id"]
-                    break
-            if not folder_id:
-                raise ValueError(f"Carpeta no encontrada: {folder}")
-            response = self.graph_client.make_request(
-                "POST",
-                f"messages/{email_id}/move",
-                json_data={"destinationId": folder_id},
-            )
-            # La respuesta de Graph API contiene el correo movido con su nuevo ID
-            nuevo_id = response.get("id", None) if response else None
-            logger.info(
-                f"Correo {email_id} movido a carpeta {folder}. Nuevo ID: {nuevo_id}"
-            )
-            return nuevo_id if nuevo_id else email_id
-        except Exception as e:
-            logger.error(f"Error moviendo correo: {e}")
-            return email_id  # Retornar ID original si falla
+        warnings.warn(
+            "move_to_folder está obsoleto, usar move_email",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.move_email(email_id, folder) or email_id
 
     def test_reader_email(self) -> bool:
         """
@@ -402,28 +654,28 @@ class GraphEmailReader:
             .encode("ASCII", "ignore")
             .decode("ASCII")
         )
-        subject = re.sub(r"[^A-Za-z0-9_\\-]", " ", subject)
-        return subject
+        return _SUBJECT_CLEAN_RE.sub(" ", subject)
 
-    def move_email(self, email_id: str, destination_folder: str) -> bool:
+    def move_email(self, email_id: str, destination_folder: str) -> Optional[str]:
         """
         Mueve un correo a otra carpeta.
 
         Args:
             email_id: ID del correo a mover
-            destination_folder: Nombre de la carpeta destino
+            destination_folder: Nombre o ID de la carpeta destino
 
         Returns:
-            True si se movió exitosamente, False en caso contrario
+            Nuevo ID del correo movido (Graph cambia el ID al mover),
+            None si no se pudo mover
         """
         try:
-            # Primero obtener el ID de la carpeta destino (usa resolvedor existente)
+            # Primero obtener el ID de la carpeta destino (usa resolvedor con caché)
             folder_id = self._resolve_folder_id(destination_folder)
             if not folder_id:
                 logger.error(
                     f"No se encontró la carpeta '{destination_folder}'"
                 )
-                return False
+                return None
 
             # Mover el correo usando la API de Graph
             endpoint = f"messages/{email_id}/move"
@@ -434,14 +686,16 @@ class GraphEmailReader:
             )
 
             if response:
+                # La respuesta contiene el correo movido con su nuevo ID
+                nuevo_id = response.get("id") or email_id
                 logger.info(
-                    f"Correo {email_id} movido a '{destination_folder}'"
+                    f"Correo {email_id} movido a '{destination_folder}'. Nuevo ID: {nuevo_id}"
                 )
-                return True
+                return nuevo_id
             else:
                 logger.error(f"Error moviendo correo {email_id}")
-                return False
+                return None
 
         except Exception as e:
             logger.error(f"Error moviendo correo {email_id}: {e}")
-            return False
+            return None
@@ -4,14 +4,31 @@ Enviador de correos electrónicos usando Microsoft Graph API.
 Permite enviar correos con contenido HTML y adjuntos.
 """
 
-import base64
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Union, Any, Tuple
+
+try:
+    from pybase64 import b64encode_as_string  # Codificación SIMD (opcional)
+except ImportError:
+    from base64 import b64encode
+
+    def b64encode_as_string(data) -> str:
+        """Codifica en base64 y retorna str (respaldo con la librería estándar)."""
+        return b64encode(data).decode("ascii")
 
 from .graph_api_client import GraphApiClient
 from shared.utils.logger import get_logger
 
 logger = get_logger("GraphEmailSender")
 
+# Graph no admite adjuntos inline (contentBytes) de más de 3 MB
+LARGE_ATTACHMENT_SIZE = 3 * 1024 * 1024
+
+
+class EmailSenderError(Exception):
+    """Excepción para errores del enviador de correos."""
+
+    pass
+
 
 class GraphEmailSender:
     """
@@ -57,6 +74,8 @@ class GraphEmailSender:
                 "status": str,
                 "recipients": List[str],
                 "cc_recipients": List[str] (opcional),
+                "uploaded_attachments": List[str] (adjuntos > 3 MB subidos
+                    por sesión de carga, solo si los hay),
                 "error": str (si hay error)
             }
         """
@@ -70,19 +89,25 @@ class GraphEmailSender:
                     [cc_recipients] if isinstance(cc_recipients, str) else cc_recipients
                 )
 
-            message = {
-                "subject": subject,
-                "body": {"contentType": "HTML", "content": html_content},
-                "toRecipients": [
-                    {"emailAddress": {"address": email}} for email in to_list
-                ],
-            }
-            if cc_list:
-                message["ccRecipients"] = [
-                    {"emailAddress": {"address": email}} for email in cc_list
-                ]
-            if attachments:
-                message["attachments"] = self._process_attachments(attachments)
+            small, large = self._split_attachments(attachments or [])
+            message = self._build_message(
+                subject,
+                html_content,
+                to_list,
+                cc_list,
+                self._process_attachments(small) if small else None,
+            )
+
+            if large:
+                message_id = self._send_with_upload_session(message, large)
+                return {
+                    "success": True,
+                    "message_id": message_id,
+                    "status": "sent",
+                    "recipients": to_list,
+                    "cc_recipients": cc_list or [],
+                    "uploaded_attachments": [att["filename"] for att in large],
+                }
 
             response = self.graph_client.make_request(
                 method="POST", endpoint="sendMail", json_data={"message": message}
@@ -99,6 +124,184 @@ class GraphEmailSender:
             logger.error(f"Error enviando correo: {error_msg}")
             return {"success": False, "error": error_msg, "status": "failed"}
 
+    def send_individually(
+        self,
+        subject: str,
+        html_content: str,
+        recipients: Union[str, List[str]],
+        attachments: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Envía el mismo correo por separado a cada destinatario (ninguno ve a
+        los demás), agrupando los envíos en peticiones /$batch de Graph API.
+        Con adjuntos los envíos son secuenciales: cada sub-petición repetiría
+        los adjuntos en base64 y el /$batch superaría el límite de tamaño.
+
+        Args:
+            subject: Asunto del correo
+            html_content: Contenido HTML del correo
+            recipients: Destinatarios (string o lista), uno por correo
+            attachments: Lista de adjuntos (opcional)
+
+        Returns:
+            Diccionario con resultado del envío:
+            {
+                "success": bool (True si todos se enviaron),
+                "status": str ("sent", "partial" o "failed"),
+                "recipients": List[str] (enviados),
+                "failed_recipients": List[str],
+                "error": str (si hay error)
+            }
+        """
+        try:
+            to_list = [recipients] if isinstance(recipients, str) else list(recipients)
+            if attachments:
+                return self._send_individually_sequential(
+                    subject, html_content, to_list, attachments
+                )
+            batch_items = [
+                {
+                    "method": "POST",
+                    "endpoint": "sendMail",
+                    "body": {
+                        "message": self._build_message(
+                            subject, html_content, [email], None, None
+                        ),
+                        "saveToSentItems": True,
+                    },
+                }
+                for email in to_list
+            ]
+            responses = self.graph_client.batch_request(batch_items)
+
+            sent, failed = [], []
+            for email, response in zip(to_list, responses):
+                if 200 <= response.get("status", 0) < 300:
+                    sent.append(email)
+                else:
+                    failed.append(email)
+                    logger.error(
+                        f"Error enviando correo a {email}: "
+                        f"status {response.get('status')} - {response.get('body')}"
+                    )
+
+            return self._individual_result(sent, failed)
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error enviando correos individuales: {error_msg}")
+            return {"success": False, "error": error_msg, "status": "failed"}
+
+    def _send_individually_sequential(
+        self,
+        subject: str,
+        html_content: str,
+        to_list: List[str],
+        attachments: Optional[List[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Envía un correo por destinatario con send_email y agrega los resultados."""
+        sent, failed = [], []
+        for email in to_list:
+            result = self.send_email(subject, html_content, email, attachments=attachments)
+            (sent if result.get("success") else failed).append(email)
+        return self._individual_result(sent, failed)
+
+    def _individual_result(self, sent: List[str], failed: List[str]) -> Dict[str, Any]:
+        """Construye el resultado agregado de un envío individual."""
+        result = {
+            "success": not failed,
+            "status": "sent" if not failed else ("partial" if sent else "failed"),
+            "recipients": sent,
+            "failed_recipients": failed,
+        }
+        if failed:
+            result["error"] = f"No se pudo enviar a: {', '.join(failed)}"
+        return result
+
+    def _split_attachments(
+        self, attachments: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Separa los adjuntos binarios de más de LARGE_ATTACHMENT_SIZE, que deben
+        subirse por sesión de carga, del resto (que van inline en el mensaje).
+
+        Returns:
+            Tupla (adjuntos_inline, adjuntos_grandes)
+        """
+        small, large = [], []
+        for attachment in attachments:
+            content = attachment["content"]
+            if (
+                isinstance(content, (bytes, bytearray, memoryview))
+                and memoryview(content).nbytes > LARGE_ATTACHMENT_SIZE
+            ):
+                large.append(attachment)
+            else:
+                small.append(attachment)
+        return small, large
+
+    def _send_with_upload_session(
+        self, message: Dict[str, Any], large_attachments: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Envía un mensaje con adjuntos grandes: crea un borrador, sube cada
+        adjunto por sesión de carga (sin copias base64 en memoria) y lo envía.
+
+        Returns:
+            ID del mensaje enviado
+        """
+        draft = self.graph_client.make_request(
+            method="POST", endpoint="messages", json_data=message
+        )
+        message_id = draft["id"]
+        for attachment in large_attachments:
+            content = memoryview(attachment["content"])
+            attachment_item = {
+                "attachmentType": "file",
+                "name": attachment["filename"],
+                "size": content.nbytes,
+            }
+            if attachment.get("content_type"):
+                attachment_item["contentType"] = attachment["content_type"]
+            if attachment.get("is_inline") and attachment.get("content_id"):
+                attachment_item["isInline"] = True
+                attachment_item["contentId"] = attachment["content_id"]
+            session = self.graph_client.make_request(
+                method="POST",
+                endpoint=f"messages/{message_id}/attachments/createUploadSession",
+                json_data={"AttachmentItem": attachment_item},
+            )
+            self.graph_client.upload_in_chunks(session["uploadUrl"], content)
+            logger.info(
+                f"Adjunto '{attachment['filename']}' ({content.nbytes} bytes) "
+                f"subido por sesión de carga"
+            )
+        self.graph_client.make_request(method="POST", endpoint=f"messages/{message_id}/send")
+        return message_id
+
+    def _build_message(
+        self,
+        subject: str,
+        html_content: str,
+        to_list: List[str],
+        cc_list: Optional[List[str]] = None,
+        processed_attachments: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Construye el objeto message de Graph API para sendMail."""
+        message = {
+            "subject": subject,
+            "body": {"contentType": "HTML", "content": html_content},
+            "toRecipients": [
+                {"emailAddress": {"address": email}} for email in to_list
+            ],
+        }
+        if cc_list:
+            message["ccRecipients"] = [
+                {"emailAddress": {"address": email}} for email in cc_list
+            ]
+        if processed_attachments:
+            message["attachments"] = processed_attachments
+        return message
+
     def _process_attachments(
         self, attachments: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -109,7 +312,7 @@ class GraphEmailSender:
             attachments: Lista de adjuntos con formato:
                 {
                     "filename": str,
-                    "content": bytes o str (base64),
+                    "content": bytes, bytearray, memoryview o str (base64),
                     "is_inline": bool (opcional),
                     "content_id": str (opcional),
                     "content_type": str (opcional)
@@ -117,14 +320,22 @@ class GraphEmailSender:
 
         Returns:
             Lista de adjuntos procesados para Graph API
+
+        Raises:
+            EmailSenderError: Si un adjunto str no tiene longitud base64 válida
         """
         processed_attachments = []
         for attachment in attachments:
             content = attachment["content"]
-            if isinstance(content, bytes):
-                content_base64 = base64.b64encode(content).decode("utf-8")
+            if isinstance(content, (bytes, bytearray, memoryview)):
+                content_base64 = b64encode_as_string(content)
             else:
+                # Se asume que un str ya viene codificado en base64
                 content_base64 = content
+            if len(content_base64) % 4 != 0:
+                raise EmailSenderError(
+                    f"Adjunto '{attachment['filename']}' no es base64 válido"
+                )
 
             att_dict = {
                 "@odata.type": "#microsoft.graph.fileAttachment",
@@ -16,16 +16,14 @@ from .exceptions import (
     NavigationError,
     ValidationError,
 )
-from .config_helper import load_config_from_param, validate_email_config, validate_database_config
 
 __all__ = [
     'setup_logger', 'get_logger',
     'validate_email', 'validate_url', 'validate_date',
     'format_date', 'format_datetime', 'safe_get',
-    'load_config_from_param', 'validate_email_config', 'validate_database_config'
+    'load_config_from_param', 'validate_email_config', 'validate_database_config',
     'NotificacionError', 'DatabaseError', 'AuthError',
     'TemplateError', 'NavigationError', 'ValidationError',
-    'load_config_from_param', 'validate_email_config', 'validate_database_config'
 ]
 
 
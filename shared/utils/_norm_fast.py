@@ -0,0 +1,118 @@
+# coding: utf-8
+"""
+Kernel compilado (Numba) para la normalización básica de textos en lote.
+
+Recorre los bytes UTF-8 de muchos textos unidos por NUL en una sola pasada:
+- Convierte a mayúsculas las letras ASCII
+- Elimina los acentos soportados por EntityMatcher.normalize_text (mayúsculas y minúsculas)
+- Colapsa espacios en blanco y recorta los extremos de cada texto
+
+Solo acepta textos ASCII o con esos acentos (ver es_apto); el resto debe
+normalizarse por la ruta Python. Si numba/numpy no están instalados,
+HAS_NUMBA es False y el módulo no debe usarse.
+"""
+
+from typing import List
+
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Segundo byte UTF-8 (tras 0xC3) de cada vocal acentuada / Ñ -> letra ASCII mayúscula
+_ACENTOS_UTF8 = {
+    "Á": "A", "É": "E", "Í": "I", "Ó": "O", "Ú": "U", "Ñ": "N",
+    "À": "A", "È": "E", "Ì": "I", "Ò": "O", "Ù": "U",
+    "á": "A", "é": "E", "í": "I", "ó": "O", "ú": "U", "ñ": "N",
+    "à": "A", "è": "E", "ì": "I", "ò": "O", "ù": "U",
+}
+_TABLA_C3 = bytearray(256)
+for _car, _base in _ACENTOS_UTF8.items():
+    _TABLA_C3[_car.encode("utf-8")[1]] = ord(_base)
+
+# Quita los acentos soportados para comprobar con isascii() que no queda nada más
+_QUITAR_ACENTOS = str.maketrans({car: None for car in _ACENTOS_UTF8})
+
+_SEPARADOR = "\x00"
+
+
+def es_apto(texto: str) -> bool:
+    """
+    Indica si un texto puede normalizarse con el kernel de bytes.
+
+    Args:
+        texto: Texto a comprobar.
+
+    Returns:
+        True si solo contiene ASCII (sin NUL) y acentos soportados.
+    """
+    return _SEPARADOR not in texto and texto.translate(_QUITAR_ACENTOS).isascii()
+
+
+def _normalizar_bytes_py(buf, out, tabla) -> int:
+    """
+    Normaliza buf (bytes UTF-8 de textos aptos unidos por NUL) escribiendo en out.
+
+    Args:
+        buf: Bytes de entrada.
+        out: Buffer de salida del mismo tamaño que buf.
+        tabla: Tabla de 256 entradas para el segundo byte de las secuencias 0xC3.
+
+    Returns:
+        Cantidad de bytes escritos en out.
+    """
+    n = len(buf)
+    j = 0
+    i = 0
+    al_inicio = True
+    espacio_pendiente = False
+    while i < n:
+        b = buf[i]
+        if b == 0:
+            out[j] = 0
+            j += 1
+            al_inicio = True
+            espacio_pendiente = False
+        elif b == 0x20 or (0x09 <= b <= 0x0D) or (0x1C <= b <= 0x1F):
+            if not al_inicio:
+                espacio_pendiente = True
+        else:
+            if 0x61 <= b <= 0x7A:
+                b -= 0x20
+            elif b == 0xC3:
+                i += 1
+                b = tabla[buf[i]]
+            if espacio_pendiente:
+                out[j] = 0x20
+                j += 1
+                espacio_pendiente = False
+            out[j] = b
+            j += 1
+            al_inicio = False
+        i += 1
+    return j
+
+
+if HAS_NUMBA:
+    _normalizar_bytes = njit(cache=True)(_normalizar_bytes_py)
+    _TABLA_C3_NP = np.frombuffer(bytes(_TABLA_C3), dtype=np.uint8)
+
+
+def normalizar_basico_lote(textos: List[str]) -> List[str]:
+    """
+    Aplica mayúsculas, eliminación de acentos y colapso de espacios a textos aptos.
+
+    Args:
+        textos: Textos que cumplen es_apto().
+
+    Returns:
+        Textos normalizados, en el mismo orden.
+    """
+    if not textos:
+        return []
+    buf = np.frombuffer(_SEPARADOR.join(textos).encode("utf-8"), dtype=np.uint8)
+    out = np.empty_like(buf)
+    n = _normalizar_bytes(buf, out, _TABLA_C3_NP)
+    return out[:n].tobytes().decode("ascii").split(_SEPARADOR)
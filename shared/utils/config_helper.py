@@ -5,14 +5,68 @@ Utilidad compartida para todos los módulos.
 """
 
 import os
+import copy
 import json
-from typing import Union, Dict, Any
-from shared.utils.config_parser import parse_config
+import stat
+import functools
+from typing import Union, Dict, Any, Optional
 from shared.utils.logger import get_logger
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = get_logger("ConfigHelper")
 
 
+def _stat_archivo(path: str) -> Optional[os.stat_result]:
+    """Retorna el stat de path si es un archivo regular, None en caso contrario."""
+    try:
+        file_stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
+@functools.lru_cache(maxsize=32)
+def _cargar_archivo_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Lee y parsea un archivo de configuración (JSON o diccionario Python).
+    Cacheado por (ruta, mtime): si el archivo cambia se vuelve a leer.
+    El diccionario retornado es compartido entre llamadas, no debe mutarse
+    (load_config_from_param entrega una copia).
+
+    Args:
+        path: Ruta absoluta del archivo
+        mtime_ns: Fecha de modificación del archivo (clave de invalidación)
+
+    Returns:
+        Diccionario con la configuración
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+    # Intentar leer como archivo JSON primero
+    try:
+        config = _json_loads(content)
+        logger.info(f"Configuración cargada desde archivo JSON: {path}")
+        return config
+    except ValueError:
+        pass
+    # Si falla como JSON, intentar leer como archivo Python (diccionario)
+    try:
+        import ast
+        config = ast.literal_eval(content.decode('utf-8'))
+        if isinstance(config, dict):
+            logger.info(f"Configuración cargada desde archivo Python: {path}")
+            return config
+        else:
+            raise ValueError(f"El archivo evaluado no es un diccionario: {type(config)}")
+    except Exception as eval_error:
+        logger.error(f"No se pudo parsear el archivo como JSON ni como diccionario Python: {eval_error}")
+        raise ValueError(f"Error al cargar configuración desde archivo: {eval_error}, archivo: {path}") from eval_error
+
+
 def load_config_from_param(config_param: Union[Dict[str, Any], str]) -> Dict[str, Any]:
     """
     Carga configuración desde un diccionario o ruta a archivo JSON.
@@ -23,7 +77,9 @@ def load_config_from_param(config_param: Union[Dict[str, Any], str]) -> Dict[str
             - str: Ruta a archivo JSON con configuración o string JSON
     
     Returns:
-        Diccionario con la configuración cargada
+        Diccionario con la configuración cargada. Para archivos, el parseo se
+        cachea por (ruta, mtime) y se retorna una copia independiente, que el
+        llamador puede modificar sin afectar a llamadas posteriores.
     
     Raises:
         ValueError: Si la configuración es inválida o el archivo no existe
@@ -37,30 +93,15 @@ def load_config_from_param(config_param: Union[Dict[str, Any], str]) -> Dict[str
         # Si es string, intentar cargar como archivo JSON
         if isinstance(config_param, str):
             # Verificar si es una ruta de archivo
-            if os.path.isfile(config_param):
-                # Intentar leer como archivo JSON primero
-                try:
-                    with open(config_param, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                        logger.info(f"Configuración cargada desde archivo JSON: {config_param}")
-                        return config
-                except json.JSONDecodeError:
-                    # Si falla como JSON, intentar leer como archivo Python (diccionario)
-                    try:
-                        import ast
-                        with open(config_param, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            config = ast.literal_eval(content)
-                            if isinstance(config, dict):
-                                logger.info(f"Configuración cargada desde archivo Python: {config_param}")
-                                return config
-                            else:
-                                raise ValueError(f"El archivo evaluado no es un diccionario: {type(config)}")
-                    except Exception as eval_error:
-                        logger.error(f"No se pudo parsear el archivo como JSON ni como diccionario Python: {eval_error}")
-                        raise ValueError(f"Error al cargar configuración desde archivo: {eval_error}, archivo: {config_param}") from eval_error
+            file_stat = _stat_archivo(config_param)
+            if file_stat is not None:
+                return copy.deepcopy(_cargar_archivo_config(
+                    os.path.abspath(config_param), file_stat.st_mtime_ns
+                ))
             else:
                 # Intentar parsear como string JSON
+                from shared.utils.config_parser import parse_config
+
                 try:
                     config = parse_config(config_param)
                     logger.info("Configuración parseada desde string JSON")
@@ -3,38 +3,200 @@
 Utilidades para parsear y validar configuraciones.
 """
 
-import json
-from typing import Any, Dict, Optional, Union
+import dataclasses
+import functools
+import threading
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 from shared.utils.logger import get_logger
 
+try:
+    from orjson import loads as _loads
+    HAS_ORJSON = True
+except ImportError:
+    from json import loads as _loads
+    HAS_ORJSON = False
+
+try:
+    import msgspec  # Validación de esquemas tipados (opcional)
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+try:
+    import simdjson  # Parser on-demand (opcional)
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
 logger = get_logger("ConfigParser")
 
+# Strings JSON más grandes que esto no se cachean (evita retener memoria)
+_MAX_CACHED_CONFIG_LENGTH = 64 * 1024
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_str(config: str) -> Mapping[str, Any]:
+    """Parsea un string JSON y retorna una vista inmutable cacheada."""
+    return MappingProxyType(parse_config(config))
+
+
+_simdjson_local = threading.local()
+
+
+def _get_simdjson_value(config: str, key: str, default: Any) -> Any:
+    """
+    Extrae una sola clave de un string JSON con simdjson sin materializar el
+    resto del documento. El valor se convierte a objeto Python antes de
+    reutilizar el parser (los proxies de simdjson se invalidan).
+    """
+    parser = getattr(_simdjson_local, "parser", None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    doc = parser.parse(config.encode("utf-8"))
+    value = doc.get(key, default)
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
 
-def parse_config(config: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+def _parse_config_readonly(config: Union[str, Dict[str, Any]]) -> Mapping[str, Any]:
     """
-    Parsea una configuración que puede ser string JSON o diccionario.
+    Variante de parse_config para lecturas: los strings JSON se parsean una sola
+    vez y se cachea el resultado. El resultado no debe mutarse.
+    """
+    if isinstance(config, str) and len(config) <= _MAX_CACHED_CONFIG_LENGTH:
+        return _parse_str(config)
+    return parse_config(config)
+
+
+@functools.singledispatch
+def parse_config(
+    config: Union[str, bytes, bytearray, memoryview, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Parsea una configuración que puede ser string JSON, bytes JSON (UTF-8) o diccionario.
+    El tipo de entrada se resuelve con singledispatch (un handler por tipo).
     
     Args:
-        config: Configuración como string JSON o diccionario
+        config: Configuración como string JSON, bytes/bytearray/memoryview
+            (ej: cuerpo de una respuesta HTTP) o diccionario
     
     Returns:
         Diccionario con la configuración parseada
     
     Example:
         config = parse_config('{"key": "value"}')
+        config = parse_config(response.content)
         config = parse_config({"key": "value"})
     """
-    if isinstance(config, dict):
-        return config
-    
-    if isinstance(config, str):
+    raise TypeError(f"Tipo de configuración no soportado: {type(config)}")
+
+
+@parse_config.register(dict)
+def _parse_config_dict(config: Dict[str, Any]) -> Dict[str, Any]:
+    return config
+
+
+@parse_config.register(str)
+@parse_config.register(bytes)
+@parse_config.register(bytearray)
+def _parse_config_json(config: Union[str, bytes, bytearray]) -> Dict[str, Any]:
+    # orjson consume los bytes directamente, sin decodificar a str
+    try:
+        return _loads(config)
+    except ValueError as e:
+        logger.error(f"Error al parsear JSON: {e}, configuración: {config}")
+        raise ValueError(f"Configuración JSON inválida: {e}, configuración: {config}")
+
+
+@parse_config.register(memoryview)
+def _parse_config_memoryview(config: memoryview) -> Dict[str, Any]:
+    # json.loads (respaldo) no acepta memoryview
+    return _parse_config_json(config if HAS_ORJSON else config.tobytes())
+
+
+class FrozenConfig(Mapping):
+    """
+    Vista inmutable de una configuración parseada.
+    Permite acceso por clave (config["host"]) y por atributo (config.host).
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any]):
+        object.__setattr__(self, "_data", MappingProxyType(dict(data)))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __getattr__(self, key: str) -> Any:
+        # Los nombres privados/especiales no son claves; copy y pickle los consultan
+        # antes de que exista _data
+        if key.startswith("_"):
+            raise AttributeError(key)
         try:
-            return json.loads(config)
-        except json.JSONDecodeError as e:
-            logger.error(f"Error al parsear JSON: {e}, configuración: {config}")
-            raise ValueError(f"Configuración JSON inválida: {e}, configuración: {config}")
+            return self._data[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError("FrozenConfig es inmutable")
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenConfig({dict(self._data)!r})"
+
+    def __reduce__(self):
+        return (FrozenConfig, (dict(self._data),))
+
+    def __copy__(self) -> "FrozenConfig":
+        # Es inmutable: la copia superficial puede ser el mismo objeto
+        return self
+
+
+def parse_frozen_config(
+    config: Union[str, bytes, bytearray, memoryview, Dict[str, Any]],
+    schema: Optional[type] = None,
+) -> Any:
+    """
+    Parsea una configuración y la retorna como objeto inmutable.
     
-    raise TypeError(f"Tipo de configuración no soportado: {type(config)}")
+    Args:
+        config: Configuración como string JSON, bytes o diccionario
+        schema: Clase opcional (ej: @dataclass(frozen=True, slots=True)) que recibe
+            las claves de la configuración como argumentos. Las claves que el
+            esquema no declara se ignoran.
+    
+    Returns:
+        Instancia de schema, o FrozenConfig si no se indica esquema
+    
+    Raises:
+        TypeError: Si faltan claves requeridas por el esquema
+    
+    Example:
+        @dataclass(frozen=True, slots=True)
+        class DbConfig:
+            host: str
+            port: int = 1433
+        
+        db = parse_frozen_config('{"host": "localhost"}', DbConfig)
+    """
+    parsed = parse_config(config)
+    if schema is None:
+        return FrozenConfig(parsed)
+    if dataclasses.is_dataclass(schema):
+        names = {f.name for f in dataclasses.fields(schema) if f.init}
+        return schema(**{k: v for k, v in parsed.items() if k in names})
+    return schema(**parsed)
 
 
 def get_config_value(config: Union[str, Dict[str, Any]], key: str, 
@@ -48,10 +210,18 @@ def get_config_value(config: Union[str, Dict[str, Any]], key: str,
         default: Valor por defecto si no se encuentra
     
     Returns:
-        Valor encontrado o valor por defecto
+        Valor encontrado o valor por defecto. Si config es un string JSON, los
+        valores anidados provienen de una caché compartida y no deben mutarse.
     """
     try:
-        parsed_config = parse_config(config)
+        # Documentos grandes (no cacheados): extraer solo la clave pedida
+        if (
+            HAS_SIMDJSON
+            and isinstance(config, str)
+            and len(config) > _MAX_CACHED_CONFIG_LENGTH
+        ):
+            return _get_simdjson_value(config, key, default)
+        parsed_config = _parse_config_readonly(config)
         return parsed_config.get(key, default)
     except Exception as e:
         logger.warning(f"Error al obtener valor de configuración: {e}")
@@ -71,7 +241,7 @@ def validate_required_keys(config: Union[str, Dict[str, Any]],
         True si todas las claves están presentes, False en caso contrario
     """
     try:
-        parsed_config = parse_config(config)
+        parsed_config = _parse_config_readonly(config)
         missing_keys = [key for key in required_keys if key not in parsed_config]
         
         if missing_keys:
@@ -84,25 +254,86 @@ def validate_required_keys(config: Union[str, Dict[str, Any]],
         return False
 
 
-def merge_configs(*configs: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+def validate_schema(config: Union[str, bytes, Dict[str, Any]], struct_cls: type) -> bool:
     """
-    Combina múltiples configuraciones, las últimas tienen prioridad.
+    Valida una configuración contra un esquema tipado msgspec.Struct.
+    Para strings JSON el parseo y la validación ocurren en una sola pasada.
     
     Args:
-        *configs: Configuraciones a combinar
+        config: Configuración como string JSON o diccionario
+        struct_cls: Subclase de msgspec.Struct con las claves requeridas y sus tipos
     
     Returns:
-        Diccionario con configuraciones combinadas
-    """
-    merged = {}
+        True si la configuración cumple el esquema, False en caso contrario
+    
+    Raises:
+        ImportError: Si msgspec no está instalado
     
+    Example:
+        class DbConfig(msgspec.Struct):
+            host: str
+            port: int
+        
+        validate_schema('{"host": "localhost", "port": 1433}', DbConfig)
+    """
+    if not HAS_MSGSPEC:
+        logger.error("msgspec no está instalado. Instala con: pip install msgspec")
+        raise ImportError("msgspec es requerido para validate_schema")
+    try:
+        if isinstance(config, (str, bytes)):
+            msgspec.json.decode(config, type=struct_cls)
+        else:
+            msgspec.convert(parse_config(config), struct_cls)
+        return True
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        logger.error(f"Configuración no cumple el esquema {struct_cls.__name__}: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Error al validar configuración: {e}")
+        return False
+
+
+def _parse_configs(configs: tuple) -> list:
+    """Parsea cada configuración, omitiendo (con advertencia) las inválidas."""
+    parsed = []
     for config in configs:
         try:
-            parsed = parse_config(config)
-            merged.update(parsed)
+            result = parse_config(config)
         except Exception as e:
             logger.warning(f"Error al combinar configuración: {e}")
             continue
+        if isinstance(result, Mapping):
+            parsed.append(result)
+        else:
+            logger.warning(
+                f"Error al combinar configuración: se esperaba un objeto JSON, "
+                f"se obtuvo {type(result).__name__}"
+            )
+    return parsed
+
+
+def merge_configs(*configs: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combina múltiples configuraciones, las últimas tienen prioridad.
+    
+    Args:
+        *configs: Configuraciones a combinar
     
-    return merged
+    Returns:
+        Diccionario con configuraciones combinadas
+    """
+    return dict(ChainMap(*reversed(_parse_configs(configs))))
 
+
+def merge_configs_lazy(*configs: Union[str, Dict[str, Any]]) -> Mapping[str, Any]:
+    """
+    Combina múltiples configuraciones sin copiarlas (vista ChainMap),
+    las últimas tienen prioridad. Útil cuando el resultado solo se consulta.
+    
+    Args:
+        *configs: Configuraciones a combinar
+    
+    Returns:
+        Vista con las configuraciones combinadas (refleja cambios en los dicts originales)
+    """
+    return ChainMap(*reversed(_parse_configs(configs)))
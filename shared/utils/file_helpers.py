@@ -4,13 +4,23 @@ Utilidades para manejo de archivos y descargas.
 """
 
 import os
+import stat
 import shutil
+import fnmatch
 from typing import List, Optional
 from pathlib import Path
 from shared.utils.logger import get_logger
 
 logger = get_logger("FileHelpers")
 
+# Referencias locales para utilidades llamadas por cada archivo
+_SEP = os.sep
+_join = os.path.join
+_normpath = os.path.normpath
+
+# Caracteres inválidos en nombres de archivo -> '_'
+_INVALID_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 
 def ensure_directory(path: str) -> str:
     """
@@ -24,11 +34,9 @@ def ensure_directory(path: str) -> str:
     """
     try:
         normalized_path = os.path.normpath(path)
-        if not os.path.exists(normalized_path):
-            os.makedirs(normalized_path)
-            logger.info(f"Directorio creado: {normalized_path}")
+        os.makedirs(normalized_path, exist_ok=True)
         return normalized_path
-    except Exception as e:
+    except OSError as e:
         logger.error(f"Error al crear directorio: {e}")
         raise
 
@@ -44,23 +52,43 @@ def safe_filename(filename: str, max_length: int = 255) -> str:
     Returns:
         Nombre de archivo sanitizado
     """
-    # Caracteres inválidos en nombres de archivo
-    invalid_chars = '<>:"/\\|?*'
-    
     # Reemplazar caracteres inválidos
-    sanitized = filename
-    for char in invalid_chars:
-        sanitized = sanitized.replace(char, '_')
+    sanitized = filename.translate(_INVALID_FILENAME_TRANS)
     
     # Limitar longitud
     if len(sanitized) > max_length:
-        name, ext = os.path.splitext(sanitized)
-        max_name_length = max_length - len(ext)
-        sanitized = name[:max_name_length] + ext
+        name, sep, ext = sanitized.rpartition('.')
+        # Solo se conserva como extensión un sufijo corto (no un punto en el nombre)
+        if sep and name and len(ext) < 10:
+            sanitized = name[:max_length - len(ext) - 1] + '.' + ext
+        else:
+            sanitized = sanitized[:max_length]
     
     return sanitized
 
 
+def stat_file(filepath: str) -> Optional[os.stat_result]:
+    """
+    Obtiene el stat de un archivo con una sola llamada al sistema.
+    Permite consultar existencia y tamaño sin repetir syscalls.
+    
+    Args:
+        filepath: Ruta del archivo
+    
+    Returns:
+        Resultado de os.stat o None si no existe o no es accesible
+    
+    Example:
+        st = stat_file(ruta)
+        if st is not None and stat.S_ISREG(st.st_mode):
+            size = st.st_size
+    """
+    try:
+        return os.stat(filepath)
+    except (OSError, ValueError):
+        return None
+
+
 def get_file_size(filepath: str) -> Optional[int]:
     """
     Obtiene el tamaño de un archivo en bytes.
@@ -71,11 +99,11 @@ def get_file_size(filepath: str) -> Optional[int]:
     Returns:
         Tamaño en bytes o None si hay error
     """
-    try:
-        return os.path.getsize(filepath)
-    except Exception as e:
-        logger.warning(f"Error al obtener tamaño de archivo: {e}")
+    st = stat_file(filepath)
+    if st is None:
+        logger.warning(f"Error al obtener tamaño de archivo: {filepath}")
         return None
+    return st.st_size
 
 
 def file_exists(filepath: str) -> bool:
@@ -88,7 +116,8 @@ def file_exists(filepath: str) -> bool:
     Returns:
         True si existe, False en caso contrario
     """
-    return os.path.isfile(filepath)
+    st = stat_file(filepath)
+    return st is not None and stat.S_ISREG(st.st_mode)
 
 
 def list_files(directory: str, pattern: Optional[str] = None) -> List[str]:
@@ -97,26 +126,21 @@ def list_files(directory: str, pattern: Optional[str] = None) -> List[str]:
     
     Args:
         directory: Directorio donde buscar
-        pattern: Patrón opcional para filtrar (ej: "*.pdf")
+        pattern: Patrón glob opcional para filtrar (ej: "*.pdf", "reporte_*.csv")
     
     Returns:
         Lista de rutas de archivos
     """
     try:
-        if not os.path.exists(directory):
-            return []
+        # scandir reutiliza el tipo de entrada de getdents (sin stat extra por archivo)
+        with os.scandir(directory) as entries:
+            files = {entry.name: entry.path for entry in entries if entry.is_file()}
         
-        files = []
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            if os.path.isfile(item_path):
-                if pattern:
-                    if item.endswith(pattern.replace('*', '')):
-                        files.append(item_path)
-                else:
-                    files.append(item_path)
-        
-        return files
+        if pattern:
+            return [files[name] for name in fnmatch.filter(files, pattern)]
+        return list(files.values())
+    except FileNotFoundError:
+        return []
     except Exception as e:
         logger.error(f"Error al listar archivos: {e}")
         return []
@@ -143,13 +167,16 @@ def delete_file(filepath: str) -> bool:
         return False
 
 
-def copy_file(source: str, destination: str) -> bool:
+def copy_file(source: str, destination: str, preserve_metadata: bool = True) -> bool:
     """
     Copia un archivo de una ubicación a otra.
     
     Args:
         source: Ruta del archivo origen
         destination: Ruta del archivo destino
+        preserve_metadata: Si True copia también permisos y fechas (shutil.copy2).
+            Si False usa shutil.copyfile, que en Linux copia en el kernel
+            (sendfile/copy_file_range); recomendado para copias masivas.
     
     Returns:
         True si se copió exitosamente, False en caso contrario
@@ -158,9 +185,12 @@ def copy_file(source: str, destination: str) -> bool:
         # Asegurar que el directorio destino existe
         dest_dir = os.path.dirname(destination)
         if dest_dir:
-            ensure_directory(dest_dir)
+            os.makedirs(dest_dir, exist_ok=True)
         
-        shutil.copy2(source, destination)
+        if preserve_metadata:
+            shutil.copy2(source, destination)
+        else:
+            shutil.copyfile(source, destination)
         logger.info(f"Archivo copiado: {source} -> {destination}")
         return True
     except Exception as e:
@@ -178,8 +208,12 @@ def get_file_extension(filepath: str) -> str:
     Returns:
         Extensión del archivo (sin el punto)
     """
-    _, ext = os.path.splitext(filepath)
-    return ext.lstrip('.')
+    # Equivalente a os.path.splitext sin su lógica genérica de separadores
+    slash = max(filepath.rfind('/'), filepath.rfind(_SEP))
+    dot = filepath.rfind('.')
+    if dot <= slash + 1 or not filepath[slash + 1:dot].strip('.'):
+        return ''
+    return filepath[dot + 1:]
 
 
 def join_path(*parts: str) -> str:
@@ -192,5 +226,5 @@ def join_path(*parts: str) -> str:
     Returns:
         Ruta unida y normalizada
     """
-    return os.path.normpath(os.path.join(*parts))
+    return _normpath(_join(*parts))
 
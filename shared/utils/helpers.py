@@ -4,7 +4,11 @@ Funciones auxiliares reutilizables.
 """
 
 from datetime import datetime
-from typing import Any, Optional, Dict, List
+from itertools import islice
+from typing import Any, Optional, Dict, List, Iterable, Iterator
+
+# Valores de texto que parse_bool interpreta como True
+_TRUTHY_STRINGS = frozenset({'true', '1', 'yes', 'on', 'si', 'sí'})
 
 
 def format_date(date: datetime, format_string: str = "%Y-%m-%d") -> str:
@@ -21,6 +25,9 @@ def format_date(date: datetime, format_string: str = "%Y-%m-%d") -> str:
     Example:
         formatted = format_date(datetime.now(), "%Y-%m-%d %H:%M:%S")
     """
+    if format_string == "%Y-%m-%d":
+        # isoformat está implementado en C y evita el parseo del formato
+        return (date.date() if isinstance(date, datetime) else date).isoformat()
     return date.strftime(format_string)
 
 
@@ -34,6 +41,9 @@ def format_datetime(dt: datetime) -> str:
     Returns:
         Datetime formateado como "YYYY-MM-DD HH:MM:SS"
     """
+    if dt.tzinfo is None:
+        return dt.isoformat(sep=' ', timespec='seconds')
+    # isoformat agregaría el offset (+00:00), se mantiene el formato sin zona
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
@@ -69,7 +79,34 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     Example:
         chunks = chunk_list([1, 2, 3, 4, 5], 2)  # [[1, 2], [3, 4], [5]]
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    return list(chunk_iter(lst, chunk_size))
+
+
+def chunk_iter(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Genera chunks de tamaño especificado de forma perezosa.
+    Acepta cualquier iterable (listas, generadores, cursores de BD...).
+    
+    Args:
+        items: Iterable a dividir
+        chunk_size: Tamaño de cada chunk
+    
+    Returns:
+        Iterador de chunks (listas)
+    
+    Example:
+        for chunk in chunk_iter(registros, 500):
+            guardar_lote(chunk)
+    """
+    if isinstance(items, list):
+        for i in range(0, len(items), chunk_size):
+            yield items[i:i + chunk_size]
+        return
+    iterator = iter(items)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
 
 
 def clean_string(text: str) -> str:
@@ -100,9 +137,11 @@ def parse_bool(value: Any) -> bool:
         bool_val = parse_bool("false")  # False
         bool_val = parse_bool(1)  # True
     """
-    if isinstance(value, bool):
+    if value is True or value is False:
         return value
+    if type(value) is int:
+        return value != 0
     if isinstance(value, str):
-        return value.lower() in ('true', '1', 'yes', 'on', 'si', 'sí')
+        return value.lower() in _TRUTHY_STRINGS
     return bool(value)
 
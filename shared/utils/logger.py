@@ -6,11 +6,18 @@ Configura los loggers para escribir en archivos CSV según la configuración pro
 Si no se proporciona configuración, usa valores por defecto basados en base_path.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional, Dict, Any
-from datetime import datetime
+import threading
+import weakref
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta
 import os
+import time
 
 # Exportar funciones públicas
 __all__ = [
@@ -23,10 +30,88 @@ __all__ = [
 # Variable global para caché de base_path
 _base_path_cache: Optional[str] = None
 
+# Raíz del proyecto calculada desde este archivo, con separador al final
+# shared/utils/logger.py -> shared/utils/ -> shared/ -> raíz del proyecto
+_DEFAULT_BASE = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) + os.sep
+
 # Configuración global de logs (se establece cuando se inicializa el logger del módulo)
 _logs_config_global: Optional[Dict[str, Any]] = None
 _ruta_base_global: Optional[str] = None
 
+# Logger de diagnóstico interno; solo emite si LOGGER_DEBUG=1 en el entorno.
+# Los bloques se escriben como "if __debug__ and _DEBUG_ON:" para que python -O los elimine
+_DEBUG_ON = os.environ.get("LOGGER_DEBUG") == "1"
+_DEBUG = logging.getLogger("LoggerDebug")
+if __debug__ and _DEBUG_ON and not _DEBUG.handlers:
+    _DEBUG.addHandler(logging.StreamHandler())
+    _DEBUG.setLevel(logging.INFO)
+
+# Caché de la fecha YYYYMMDD; "expira" es el timestamp de la próxima medianoche local
+_DATE_CACHE: Dict[str, Any] = {"expira": 0.0, "valor": ""}
+
+# Directorios de log ya creados en este proceso
+_KNOWN_DIRS: set = set()
+
+# Caché de configuraciones normalizadas: (id(config), ruta_base, fecha) -> (config, resultado)
+_NORM_CACHE: Dict[tuple, tuple] = {}
+_NORM_CACHE_MAX = 32
+# Última normalización: (config, ruta_base, fecha, resultado); atajo para el caso estable
+_LAST_NORM: tuple = (None, None, "", None)
+
+# Loggers ya configurados por get_logger: nombre -> (config, ruta_base, fecha)
+_CONFIGURED: Dict[str, tuple] = {}
+
+# Escritura asíncrona: los loggers encolan registros y un único hilo escribe los archivos
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_FILE_HANDLERS: Dict[str, logging.Handler] = {}  # ruta absoluta -> handler real de archivo
+_file_handlers_lock = threading.Lock()
+# Fecha (YYYYMMDD) de los handlers de _FILE_HANDLERS; al cambiar, el hilo escritor los cierra
+_fecha_handlers = ""
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+# Buffer de escritura de los archivos de log y periodo máximo sin flush (segundos)
+_FILE_BUFFER_SIZE = 64 * 1024
+_FLUSH_INTERVAL = 30.0
+# Handlers con buffer a los que un único hilo daemon hace flush cada _FLUSH_INTERVAL
+_HANDLERS_FLUSH: "weakref.WeakSet[logging.Handler]" = weakref.WeakSet()
+_handlers_flush_lock = threading.Lock()
+_hilo_flush: Optional[threading.Thread] = None
+
+class _FastCSVFormatter(logging.Formatter):
+    """
+    Formateador CSV (fecha,logger,nivel,mensaje) que arma la línea directamente
+    sin interpretar la plantilla y reutiliza la fecha formateada dentro del mismo segundo.
+    Los registros con excepción o stack se delegan al formateador estándar.
+    """
+    
+    def __init__(self, datefmt: str = '%Y-%m-%d %H:%M:%S'):
+        super().__init__('%(asctime)s,%(name)s,%(levelname)s,%(message)s', datefmt=datefmt)
+        self._segundo_cache: tuple = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        segundo = int(record.created)
+        cache = self._segundo_cache
+        if cache[0] == segundo and datefmt == self.datefmt:
+            return cache[1]
+        valor = super().formatTime(record, datefmt)
+        if datefmt == self.datefmt:
+            self._segundo_cache = (segundo, valor)
+        return valor
+    
+    def format(self, record: logging.LogRecord) -> str:
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        return f"{self.formatTime(record, self.datefmt)},{record.name},{record.levelname},{record.getMessage()}"
+
+
+# Formateadores compartidos (sin estado por registro): CSV para archivos y legible para consola
+_CSV_FORMATTER = _FastCSVFormatter()
+_CONSOLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
 # Valores por defecto para logs (rutas relativas desde base_path)
 _DEFAULT_LOG_CONFIG = {
     "RutaLogAuditoria": "Logs/Logs Auditoria",
@@ -53,20 +138,34 @@ def _obtener_ruta_base_proyecto() -> str:
         tmp_global_obj  # type: ignore[name-defined]
         base_path = tmp_global_obj["basepath"]
         if base_path:
-            _base_path_cache = base_path if base_path.endswith(os.sep) else base_path + os.sep
+            _base_path_cache = base_path.rstrip("/\\") + os.sep
             return _base_path_cache
     except NameError:
         pass
     
-    # Si no existe tmp_global_obj, calcular desde la ubicación del archivo
-    # shared/utils/logger.py -> shared/utils/ -> shared/ -> raíz del proyecto
-    current_file = os.path.abspath(__file__)
-    # Subir 3 niveles: shared/utils/logger.py -> shared/utils/ -> shared/ -> raíz
-    base_path = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-    _base_path_cache = base_path + os.sep
+    # Si no existe tmp_global_obj, usar la raíz calculada al importar el módulo
+    _base_path_cache = _DEFAULT_BASE
     return _base_path_cache
 
 
+def _fecha_actual() -> str:
+    """
+    Retorna la fecha actual en formato YYYYMMDD.
+    El valor se recalcula solo al cruzar la medianoche local.
+    
+    Returns:
+        Fecha actual como cadena
+    """
+    if time.time() < _DATE_CACHE["expira"]:
+        return _DATE_CACHE["valor"]
+    
+    ahora = datetime.now()
+    manana = (ahora + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    _DATE_CACHE["valor"] = ahora.strftime("%Y%m%d")
+    _DATE_CACHE["expira"] = manana.timestamp()
+    return _DATE_CACHE["valor"]
+
+
 def _reemplazar_fecha_en_nombre(nombre: str) -> str:
     """
     Reemplaza YYYYMMDD en el nombre del archivo con la fecha actual.
@@ -77,8 +176,7 @@ def _reemplazar_fecha_en_nombre(nombre: str) -> str:
     Returns:
         Nombre con la fecha reemplazada
     """
-    fecha_actual = datetime.now().strftime("%Y%m%d")
-    return nombre.replace("YYYYMMDD", fecha_actual)
+    return nombre.replace("YYYYMMDD", _fecha_actual())
 
 
 def _construir_ruta_log(ruta_relativa: str, nombre_archivo: str, ruta_base: Optional[str] = None) -> str:
@@ -93,25 +191,103 @@ def _construir_ruta_log(ruta_relativa: str, nombre_archivo: str, ruta_base: Opti
     Returns:
         Ruta completa del archivo de log normalizada
     """
+    return os.path.join(*_construir_ruta_log_partes(ruta_relativa, nombre_archivo, ruta_base))
+
+
+def _construir_ruta_log_partes(ruta_relativa: str, nombre_archivo: str,
+                               ruta_base: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Construye la ruta del archivo de log ya separada en (directorio, nombre).
+    
+    Args:
+        ruta_relativa: Ruta relativa desde base_path
+        nombre_archivo: Nombre del archivo (puede contener YYYYMMDD)
+        ruta_base: Ruta base del proyecto (opcional, usa base_path calculado si no se proporciona)
+        
+    Returns:
+        Tupla (directorio, nombre) de la ruta normalizada
+    """
     # Obtener ruta base del proyecto
     if ruta_base is None:
         ruta_base = _obtener_ruta_base_proyecto()
-    elif not ruta_base.endswith(os.sep):
-        ruta_base = ruta_base + os.sep
     
-    # Limpiar ruta relativa (remover / inicial si existe)
-    ruta_relativa = ruta_relativa.lstrip("/\\")
-    
-    # Reemplazar fecha en nombre
-    nombre_archivo = _reemplazar_fecha_en_nombre(nombre_archivo)
+    # La fecha se resuelve antes de la caché para que el resultado cambie con el día
+    return _partes_ruta_log(ruta_base, ruta_relativa, _reemplazar_fecha_en_nombre(nombre_archivo))
+
+
+@lru_cache(maxsize=64)
+def _partes_ruta_log(ruta_base: str, ruta_relativa: str, nombre_archivo: str) -> Tuple[str, str]:
+    """
+    Une y normaliza la ruta del log y la separa en (directorio, nombre).
+    Las entradas son estáticas por configuración, así que el resultado se memoiza.
     
-    # Construir y normalizar ruta completa
-    ruta_completa = os.path.normpath(os.path.join(ruta_base, ruta_relativa, nombre_archivo))
+    Args:
+        ruta_base: Ruta base del proyecto
+        ruta_relativa: Ruta relativa desde la base (se ignoran separadores iniciales)
+        nombre_archivo: Nombre del archivo con la fecha ya reemplazada
+        
+    Returns:
+        Tupla (directorio, nombre) de la ruta normalizada
+    """
+    ruta_completa = os.path.normpath(os.path.join(ruta_base, ruta_relativa.lstrip("/\\"), nombre_archivo))
+    return os.path.split(ruta_completa)
+
+
+def _config_desde_partes(auditoria: Tuple[str, str], sistema: Tuple[str, str]) -> Dict[str, Any]:
+    """
+    Arma la configuración normalizada a partir de las rutas separadas.
     
-    return ruta_completa
+    Args:
+        auditoria: Tupla (directorio, nombre) del log de auditoría
+        sistema: Tupla (directorio, nombre) del log de sistema
+        
+    Returns:
+        Diccionario normalizado con claves "auditoria" y "sistema"
+    """
+    return {
+        "auditoria": {"ruta": auditoria[0], "nombre": auditoria[1]},
+        "sistema": {"ruta": sistema[0], "nombre": sistema[1]}
+    }
 
 
 def _normalizar_logs_config(logs_config: Optional[Dict[str, Any]], ruta_base: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Normaliza la configuración de logs al formato esperado, memoizando el resultado.
+    
+    La clave es la identidad de logs_config, ruta_base y la fecha actual (las rutas
+    contienen YYYYMMDD), por lo que la configuración debe tratarse como inmutable una
+    vez entregada. El resultado es compartido entre llamadas y no debe modificarse.
+    
+    Args:
+        logs_config: Configuración de logs (ver _normalizar_logs_config_sin_cache)
+        ruta_base: Ruta base del proyecto (opcional)
+    
+    Returns:
+        Diccionario normalizado con claves "auditoria" y "sistema"
+    """
+    global _LAST_NORM
+    
+    fecha = _fecha_actual()
+    ultimo = _LAST_NORM
+    if ultimo[0] is logs_config and ultimo[1] == ruta_base and ultimo[2] == fecha:
+        return ultimo[3]
+    
+    clave = (id(logs_config), ruta_base, fecha)
+    entrada = _NORM_CACHE.get(clave)
+    # Se compara identidad para no confundir un id reutilizado por otro objeto
+    if entrada is not None and entrada[0] is logs_config:
+        resultado = entrada[1]
+    else:
+        resultado = _normalizar_logs_config_sin_cache(logs_config, ruta_base)
+        if len(_NORM_CACHE) >= _NORM_CACHE_MAX:
+            _NORM_CACHE.clear()
+        _NORM_CACHE[clave] = (logs_config, resultado)
+    
+    _LAST_NORM = (logs_config, ruta_base, fecha, resultado)
+    return resultado
+
+
+def _normalizar_logs_config_sin_cache(logs_config: Optional[Dict[str, Any]], ruta_base: Optional[str] = None) -> Dict[str, Any]:
     """
     Normaliza la configuración de logs al formato esperado.
     Acepta formato normalizado o formato con estructura de Logs.
@@ -142,17 +318,10 @@ def _normalizar_logs_config(logs_config: Optional[Dict[str, Any]], ruta_base: Op
             "auditoria": logs_config.get("auditoria", {}),
             "sistema": logs_config.get("sistema", {})
         }
-        # Debug: Log para verificar qué se está normalizando
-        try:
-            import logging as logging_module
-            debug_logger = logging_module.getLogger("LoggerDebug")
-            if not debug_logger.handlers:
-                debug_logger.addHandler(logging_module.StreamHandler())
-            debug_logger.info(f"[DEBUG _normalizar_logs_config] logs_config ya normalizado detectado")
-            debug_logger.info(f"[DEBUG _normalizar_logs_config] resultado auditoria: {resultado.get('auditoria')}")
-            debug_logger.info(f"[DEBUG _normalizar_logs_config] resultado sistema: {resultado.get('sistema')}")
-        except Exception:
-            pass
+        if __debug__ and _DEBUG_ON:
+            _DEBUG.info("[DEBUG _normalizar_logs_config] logs_config ya normalizado detectado")
+            _DEBUG.info("[DEBUG _normalizar_logs_config] resultado auditoria: %s", resultado["auditoria"])
+            _DEBUG.info("[DEBUG _normalizar_logs_config] resultado sistema: %s", resultado["sistema"])
         # Si falta alguno, completar con valores por defecto
         if not resultado["auditoria"] or not resultado["sistema"]:
             default_config = _obtener_configuracion_logs_con_fallback(ruta_base)
@@ -182,19 +351,10 @@ def _normalizar_logs_config(logs_config: Optional[Dict[str, Any]], ruta_base: Op
         nombre_sistema = logs_config_raw.get("NombreLogSistema") or _DEFAULT_LOG_CONFIG["NombreLogSistema"]
         
         # Construir rutas completas
-        ruta_auditoria_completa = _construir_ruta_log(ruta_auditoria, nombre_auditoria, ruta_base)
-        ruta_sistema_completa = _construir_ruta_log(ruta_sistema, nombre_sistema, ruta_base)
-        
-        return {
-            "auditoria": {
-                "ruta": os.path.dirname(ruta_auditoria_completa),
-                "nombre": os.path.basename(ruta_auditoria_completa)
-            },
-            "sistema": {
-                "ruta": os.path.dirname(ruta_sistema_completa),
-                "nombre": os.path.basename(ruta_sistema_completa)
-            }
-        }
+        return _config_desde_partes(
+            _construir_ruta_log_partes(ruta_auditoria, nombre_auditoria, ruta_base),
+            _construir_ruta_log_partes(ruta_sistema, nombre_sistema, ruta_base)
+        )
     
     # Si no coincide con ningún formato conocido, usar valores por defecto
     return _obtener_configuracion_logs_con_fallback(ruta_base)
@@ -222,84 +382,368 @@ def _obtener_configuracion_logs_con_fallback(ruta_base: Optional[str] = None) ->
     nombre_sistema = _DEFAULT_LOG_CONFIG["NombreLogSistema"]
     
     # Construir rutas completas usando base_path
-    ruta_auditoria_completa = _construir_ruta_log(ruta_auditoria, nombre_auditoria, ruta_base)
-    ruta_sistema_completa = _construir_ruta_log(ruta_sistema, nombre_sistema, ruta_base)
+    return _config_desde_partes(
+        _construir_ruta_log_partes(ruta_auditoria, nombre_auditoria, ruta_base),
+        _construir_ruta_log_partes(ruta_sistema, nombre_sistema, ruta_base)
+    )
+
+
+def _bucle_flush() -> None:
+    """Cuerpo del hilo de flush compartido por todos los handlers con buffer."""
+    while True:
+        time.sleep(_FLUSH_INTERVAL)
+        with _handlers_flush_lock:
+            handlers = list(_HANDLERS_FLUSH)
+        for handler in handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+
+class _FlushPeriodicoMixin:
+    """Registra el handler en el hilo de flush compartido (un flush cada _FLUSH_INTERVAL s)."""
     
-    return {
-        "auditoria": {
-            "ruta": os.path.dirname(ruta_auditoria_completa),
-            "nombre": os.path.basename(ruta_auditoria_completa)
-        },
-        "sistema": {
-            "ruta": os.path.dirname(ruta_sistema_completa),
-            "nombre": os.path.basename(ruta_sistema_completa)
-        }
-    }
+    def _programar_flush(self) -> None:
+        global _hilo_flush
+        with _handlers_flush_lock:
+            _HANDLERS_FLUSH.add(self)
+            if _hilo_flush is None:
+                _hilo_flush = threading.Thread(target=_bucle_flush, name="LogFlush", daemon=True)
+                _hilo_flush.start()
+    
+    def _cancelar_flush(self) -> None:
+        with _handlers_flush_lock:
+            _HANDLERS_FLUSH.discard(self)
 
 
-def _agregar_handler_archivo(logger: logging.Logger, log_file: str, level: int, formatter: logging.Formatter) -> None:
+class _BufferedFileHandler(_FlushPeriodicoMixin, logging.FileHandler):
     """
-    Agrega un handler de archivo a un logger si no existe ya.
-    
-    Args:
-        logger: Logger al que agregar el handler
-        log_file: Ruta completa del archivo de log
-        level: Nivel mínimo de logging
-        formatter: Formateador para los mensajes
+    FileHandler con buffer de 64 KiB que no hace flush por registro.
+    Hace flush con registros de nivel ERROR o superior, cada _FLUSH_INTERVAL
+    segundos y al cerrarse.
     """
-    # Debug: Log para verificar qué archivo se está intentando agregar
-    try:
-        debug_logger = logging.getLogger("LoggerDebug")
-        if not debug_logger.handlers:
-            debug_logger.addHandler(logging.StreamHandler())
-        debug_logger.info(f"[DEBUG _agregar_handler_archivo] Intentando agregar handler para: {log_file}")
-    except Exception:
-        pass
     
-    # Crear directorio si no existe
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir, exist_ok=True)
+    def __init__(self, filename: str, mode: str = 'a', encoding: Optional[str] = 'utf-8',
+                 delay: bool = False):
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay)
+        self._programar_flush()
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_FILE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+            if self.stream is None:
+                return
         try:
-            debug_logger = logging.getLogger("LoggerDebug")
-            if not debug_logger.handlers:
-                debug_logger.addHandler(logging.StreamHandler())
-            debug_logger.info(f"[DEBUG _agregar_handler_archivo] Directorio creado: {log_dir}")
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
         except Exception:
-            pass
+            self.handleError(record)
     
-    # Verificar si el logger ya tiene un handler para este archivo
-    log_file_abs = os.path.abspath(log_file)
-    tiene_handler = any(
-        isinstance(h, logging.FileHandler) and
-        hasattr(h, 'baseFilename') and
-        os.path.abspath(h.baseFilename) == log_file_abs
-        for h in logger.handlers
-    )
+    def close(self) -> None:
+        self._cancelar_flush()
+        super().close()
+
+
+class _RawFdHandler(_FlushPeriodicoMixin, logging.Handler):
+    """
+    Handler de archivo que escribe bytes con os.write sobre un descriptor en modo append,
+    sin la capa TextIOWrapper. Codifica cada línea a UTF-8 y la acumula en un buffer
+    propio de hasta _FILE_BUFFER_SIZE bytes; lo vacía al llenarse, con registros ERROR
+    o superiores, cada _FLUSH_INTERVAL segundos y al cerrarse.
+    El archivo se abre en la primera escritura, no al crear el handler.
+    Lo usa el hilo escritor de la cola para los archivos compartidos.
+    """
+    
+    terminator = '\n'
+    
+    def __init__(self, filename: str):
+        super().__init__()
+        self.baseFilename = _ruta_absoluta(filename)
+        self._fd: Optional[int] = None
+        self._buffer = bytearray()
+        self._closed = False
+        self._programar_flush()
+    
+    def _abrir(self) -> int:
+        """Abre el archivo en modo append, recreando su directorio si ya no existe."""
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            return os.open(self.baseFilename, flags, 0o644)
+        except FileNotFoundError:
+            directorio = os.path.dirname(self.baseFilename)
+            _KNOWN_DIRS.discard(directorio)
+            _asegurar_directorio(directorio)
+            return os.open(self.baseFilename, flags, 0o644)
+    
+    def _escribir_buffer(self) -> None:
+        buffer = self._buffer
+        if not buffer or self._closed:
+            return
+        try:
+            if self._fd is None:
+                self._fd = self._abrir()
+            # os.write puede escribir parcialmente; repetir hasta vaciar el buffer
+            while buffer:
+                escritos = os.write(self._fd, buffer)
+                del buffer[:escritos]
+        except OSError:
+            # Descartar lo pendiente para que el buffer no crezca sin límite y
+            # reabrir el archivo (y su directorio) en la próxima escritura
+            buffer.clear()
+            if self._fd is not None:
+                try:
+                    os.close(self._fd)
+                except OSError:
+                    pass
+                self._fd = None
+            raise
     
-    if not tiene_handler:
-        file_handler = logging.FileHandler(log_file, encoding='utf-8', mode='a')
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    def emit(self, record: logging.LogRecord) -> None:
         try:
-            debug_logger = logging.getLogger("LoggerDebug")
-            if not debug_logger.handlers:
-                debug_logger.addHandler(logging.StreamHandler())
-            debug_logger.info(f"[DEBUG _agregar_handler_archivo] Handler agregado exitosamente para: {log_file}")
-            debug_logger.info(f"[DEBUG _agregar_handler_archivo] Total handlers en logger: {len(logger.handlers)}")
+            self._buffer += (self.format(record) + self.terminator).encode('utf-8')
+            if len(self._buffer) >= _FILE_BUFFER_SIZE or record.levelno >= logging.ERROR:
+                self._escribir_buffer()
+        except RecursionError:
+            raise
         except Exception:
+            self.handleError(record)
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._escribir_buffer()
+        except OSError:
+            # Los registros pendientes ya se descartaron; emit reporta los fallos
             pass
-    else:
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        self._cancelar_flush()
+        self.acquire()
         try:
-            debug_logger = logging.getLogger("LoggerDebug")
-            if not debug_logger.handlers:
-                debug_logger.addHandler(logging.StreamHandler())
-            debug_logger.info(f"[DEBUG _agregar_handler_archivo] Handler ya existe para: {log_file}")
+            try:
+                self._escribir_buffer()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._closed = True
+        finally:
+            self.release()
+        super().close()
+
+
+class _ArchivoQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler asociado a un archivo de log.
+    Etiqueta cada registro con la ruta destino (y su formateador, para que el hilo
+    escritor pueda reabrir el archivo si cerró su handler) para enrutarlo.
+    """
+    
+    def __init__(self, ruta: str, formatter: logging.Formatter):
+        super().__init__(_LOG_QUEUE)
+        self.baseFilename = ruta
+        self.formatter_archivo = formatter
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.ec_ruta = self.baseFilename
+        record.ec_formatter = self.formatter_archivo
+        return record
+
+
+class _DespachadorArchivos(logging.Handler):
+    """
+    Handler del hilo escritor: entrega cada registro al FileHandler de su ruta.
+    Al cambiar la fecha cierra los handlers del día anterior (los archivos con
+    fecha en el nombre ya no reciben registros); los que sigan en uso se
+    reabren con el siguiente registro.
+    """
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        ruta = getattr(record, "ec_ruta", None)
+        if ruta is None:
+            return False
+        if _fecha_actual() != _fecha_handlers:
+            _cerrar_handlers_vencidos()
+        handler = _FILE_HANDLERS.get(ruta)
+        if handler is None:
+            handler = _handler_de_ruta(ruta, record.ec_formatter)
+        handler.handle(record)
+        return True
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+
+# Handlers de este módulo asociados a un archivo (todos exponen baseFilename)
+_HANDLERS_ARCHIVO = (logging.FileHandler, _ArchivoQueueHandler)
+
+
+def _detener_listener() -> None:
+    """
+    Detiene el hilo escritor vaciando antes la cola y hace flush de los archivos.
+    Se registra con atexit; puede llamarse manualmente para forzar la escritura.
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        with _file_handlers_lock:
+            handlers = list(_FILE_HANDLERS.values())
+        for handler in handlers:
+            handler.flush()
+
+
+def _handler_de_ruta(log_file_abs: str, formatter: logging.Formatter) -> logging.Handler:
+    """Retorna el handler de _FILE_HANDLERS para una ruta, creándolo si no existe."""
+    global _fecha_handlers
+    with _file_handlers_lock:
+        handler = _FILE_HANDLERS.get(log_file_abs)
+        if handler is None:
+            if not _FILE_HANDLERS:
+                _fecha_handlers = _fecha_actual()
+            handler = _RawFdHandler(log_file_abs)
+            handler.setFormatter(formatter)
+            _FILE_HANDLERS[log_file_abs] = handler
+        return handler
+
+
+def _cerrar_handlers_vencidos() -> None:
+    """Cierra y descarta los handlers de archivo abiertos en una fecha anterior."""
+    global _fecha_handlers
+    with _file_handlers_lock:
+        handlers = list(_FILE_HANDLERS.values())
+        _FILE_HANDLERS.clear()
+        _fecha_handlers = _fecha_actual()
+    for handler in handlers:
+        try:
+            handler.close()
         except Exception:
             pass
 
 
+def _obtener_handler_archivo(log_file_abs: str, formatter: logging.Formatter) -> logging.Handler:
+    """
+    Retorna el FileHandler compartido para una ruta, creándolo si no existe,
+    y asegura que el hilo escritor esté en ejecución.
+    
+    Args:
+        log_file_abs: Ruta absoluta del archivo de log
+        formatter: Formateador usado al crear el handler
+        
+    Returns:
+        Handler de archivo propiedad del hilo escritor
+    """
+    global _listener
+    with _listener_lock:
+        handler = _handler_de_ruta(log_file_abs, formatter)
+        if _listener is None:
+            _listener = logging.handlers.QueueListener(_LOG_QUEUE, _DespachadorArchivos())
+            _listener.start()
+        return handler
+
+
+atexit.register(_detener_listener)
+
+
+def _ruta_absoluta(ruta: str) -> str:
+    """
+    Normaliza una ruta a absoluta sin consultar el directorio actual cuando no hace falta.
+    Las rutas de _construir_ruta_log ya son absolutas (parten de la ruta base), así que
+    basta normpath (operación de cadenas); solo las relativas pasan por abspath (getcwd).
+    
+    Args:
+        ruta: Ruta a normalizar
+        
+    Returns:
+        Ruta absoluta normalizada
+    """
+    if os.path.isabs(ruta):
+        return os.path.normpath(ruta)
+    return os.path.abspath(ruta)
+
+
+def _asegurar_directorio(log_dir: str) -> bool:
+    """
+    Crea el directorio de logs una sola vez por proceso.
+    
+    Args:
+        log_dir: Directorio a crear (puede ser vacío)
+        
+    Returns:
+        True si se llamó a makedirs en esta invocación, False si ya era conocido
+    """
+    if not log_dir or log_dir in _KNOWN_DIRS:
+        return False
+    os.makedirs(log_dir, exist_ok=True)
+    _KNOWN_DIRS.add(log_dir)
+    return True
+
+
+def _rutas_handlers(logger: logging.Logger) -> set:
+    """
+    Retorna el conjunto de rutas absolutas de los FileHandlers agregados por este módulo.
+    El conjunto se guarda como atributo del logger para consultas O(1).
+    
+    Args:
+        logger: Logger a consultar
+        
+    Returns:
+        Conjunto mutable de rutas registradas en el logger
+    """
+    return logger.__dict__.setdefault("_ec_file_paths", set())
+
+
+def _agregar_handler_archivo(logger: logging.Logger, log_file: str, level: int, formatter: logging.Formatter) -> None:
+    """
+    Agrega un handler de archivo a un logger si no existe ya.
+    El logger recibe un QueueHandler; la escritura real la hace el hilo escritor
+    con un FileHandler compartido por todos los loggers que usan el mismo archivo.
+    
+    Args:
+        logger: Logger al que agregar el handler
+        log_file: Ruta completa del archivo de log
+        level: Nivel mínimo de logging
+        formatter: Formateador para los mensajes
+    """
+    if __debug__ and _DEBUG_ON:
+        _DEBUG.info("[DEBUG _agregar_handler_archivo] Intentando agregar handler para: %s", log_file)
+    
+    # Verificar si el logger ya tiene un handler para este archivo
+    log_file_abs = _ruta_absoluta(log_file)
+    rutas = _rutas_handlers(logger)
+    
+    if log_file_abs not in rutas:
+        # Crear directorio si no existe
+        log_dir = os.path.dirname(log_file)
+        directorio_creado = _asegurar_directorio(log_dir)
+        if __debug__ and _DEBUG_ON and directorio_creado:
+            _DEBUG.info("[DEBUG _agregar_handler_archivo] Directorio asegurado: %s", log_dir)
+        
+        _obtener_handler_archivo(log_file_abs, formatter)
+        queue_handler = _ArchivoQueueHandler(log_file_abs, formatter)
+        queue_handler.setLevel(level)
+        logger.addHandler(queue_handler)
+        rutas.add(log_file_abs)
+        if __debug__ and _DEBUG_ON:
+            _DEBUG.info("[DEBUG _agregar_handler_archivo] Handler agregado exitosamente para: %s", log_file)
+            _DEBUG.info("[DEBUG _agregar_handler_archivo] Total handlers en logger: %d", len(logger.handlers))
+    elif __debug__ and _DEBUG_ON:
+        _DEBUG.info("[DEBUG _agregar_handler_archivo] Handler ya existe para: %s", log_file)
+
+
 def _configurar_handlers_automaticos(logger: logging.Logger, logs_config: Optional[Dict[str, Any]] = None, ruta_base: Optional[str] = None) -> None:
     """
     Configura automáticamente los handlers de archivo para un logger.
@@ -317,8 +761,27 @@ def _configurar_handlers_automaticos(logger: logging.Logger, logs_config: Option
             Si no se proporciona, usa configuración global o valores por defecto basados en base_path
         ruta_base: Ruta base del proyecto (opcional, usa configuración global o base_path calculado si no se proporciona)
     """
-    global _logs_config_global, _ruta_base_global
+    # Configurar handlers de auditoría y sistema (todos los niveles: DEBUG y superior)
+    for tipo, log_file in _resolver_archivos_automaticos(logs_config, ruta_base):
+        if __debug__ and _DEBUG_ON:
+            _DEBUG.info("[DEBUG _configurar_handlers_automaticos] Agregando handler %s: %s", tipo, log_file)
+        # Usar DEBUG como nivel mínimo para capturar todos los logs
+        _agregar_handler_archivo(logger, log_file, logging.DEBUG, _CSV_FORMATTER)
+
+
+def _resolver_archivos_automaticos(logs_config: Optional[Dict[str, Any]] = None,
+                                   ruta_base: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Resuelve los archivos de log automáticos (auditoría y sistema) de un logger.
+    Si no se proporciona configuración explícita, usa la global o los valores por defecto.
     
+    Args:
+        logs_config: Configuración de logs opcional (ver _configurar_handlers_automaticos)
+        ruta_base: Ruta base del proyecto (opcional)
+        
+    Returns:
+        Lista de tuplas (tipo, ruta completa del archivo) en orden auditoría, sistema
+    """
     # Si no se proporciona configuración explícita, usar configuración global si existe
     if logs_config is None and _logs_config_global is not None:
         logs_config = _logs_config_global
@@ -328,53 +791,52 @@ def _configurar_handlers_automaticos(logger: logging.Logger, logs_config: Option
     # Normalizar configuración (siempre retorna una configuración válida)
     logs_config_normalizado = _normalizar_logs_config(logs_config, ruta_base)
     
-    # Debug: Log para verificar qué se está usando
-    try:
-        debug_logger = logging.getLogger("LoggerDebug")
-        if not debug_logger.handlers:
-            debug_logger.addHandler(logging.StreamHandler())
-        debug_logger.info(f"[DEBUG _configurar_handlers_automaticos] logs_config recibido: {logs_config}")
-        debug_logger.info(f"[DEBUG _configurar_handlers_automaticos] logs_config_normalizado: {logs_config_normalizado}")
-        if logs_config_normalizado.get("auditoria"):
-            debug_logger.info(f"[DEBUG _configurar_handlers_automaticos] auditoria ruta: {logs_config_normalizado['auditoria'].get('ruta')}, nombre: {logs_config_normalizado['auditoria'].get('nombre')}")
-        if logs_config_normalizado.get("sistema"):
-            debug_logger.info(f"[DEBUG _configurar_handlers_automaticos] sistema ruta: {logs_config_normalizado['sistema'].get('ruta')}, nombre: {logs_config_normalizado['sistema'].get('nombre')}")
-    except Exception:
-        pass
+    if __debug__ and _DEBUG_ON:
+        _DEBUG.info("[DEBUG _configurar_handlers_automaticos] logs_config recibido: %s", logs_config)
+        _DEBUG.info("[DEBUG _configurar_handlers_automaticos] logs_config_normalizado: %s", logs_config_normalizado)
     
-    # Formato estándar para logs CSV
-    formatter = logging.Formatter(
-        '%(asctime)s,%(name)s,%(levelname)s,%(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    archivos = []
+    for tipo in ("auditoria", "sistema"):
+        destino = logs_config_normalizado.get(tipo)
+        if destino:
+            archivos.append((tipo, os.path.join(destino["ruta"], destino["nombre"])))
+    return archivos
+
+
+def _consola_habilitada() -> bool:
+    """
+    Indica si se debe agregar el handler de consola.
+    EC_CC_CONSOLE_LOG=1 lo fuerza y EC_CC_CONSOLE_LOG=0 lo desactiva; sin la variable,
+    solo se agrega si sys.stdout es una terminal (en servicios y tareas programadas
+    la salida estándar no se lee y formatear cada registro para ella es trabajo perdido).
     
-    # Configurar handler de auditoría (todos los niveles: DEBUG y superior)
-    if logs_config_normalizado.get("auditoria"):
-        auditoria = logs_config_normalizado["auditoria"]
-        log_file = os.path.join(auditoria["ruta"], auditoria["nombre"])
-        try:
-            debug_logger = logging.getLogger("LoggerDebug")
-            if not debug_logger.handlers:
-                debug_logger.addHandler(logging.StreamHandler())
-            debug_logger.info(f"[DEBUG _configurar_handlers_automaticos] Agregando handler auditoria: {log_file}")
-        except Exception:
-            pass
-        # Usar DEBUG como nivel mínimo para capturar todos los logs
-        _agregar_handler_archivo(logger, log_file, logging.DEBUG, formatter)
+    Returns:
+        True si se debe registrar en consola
+    """
+    valor = os.environ.get("EC_CC_CONSOLE_LOG")
+    if valor is not None:
+        return valor == "1"
+    stdout = sys.stdout
+    try:
+        return stdout is not None and stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _log_handlers_debug(name: str, logger: logging.Logger, momento: str) -> None:
+    """
+    Emite al logger de diagnóstico el detalle de los handlers de un logger.
     
-    # Configurar handler de sistema (todos los niveles: DEBUG y superior)
-    if logs_config_normalizado.get("sistema"):
-        sistema = logs_config_normalizado["sistema"]
-        log_file = os.path.join(sistema["ruta"], sistema["nombre"])
-        try:
-            debug_logger = logging.getLogger("LoggerDebug")
-            if not debug_logger.handlers:
-                debug_logger.addHandler(logging.StreamHandler())
-            debug_logger.info(f"[DEBUG _configurar_handlers_automaticos] Agregando handler sistema: {log_file}")
-        except Exception:
-            pass
-        # Usar DEBUG como nivel mínimo para capturar todos los logs
-        _agregar_handler_archivo(logger, log_file, logging.DEBUG, formatter)
+    Args:
+        name: Nombre del logger inspeccionado
+        logger: Logger inspeccionado
+        momento: Descripción del momento ("antes de configurar", "después de configurar")
+    """
+    _DEBUG.info("[DEBUG setup_logger] Logger '%s' - handlers %s: %d", name, momento, len(logger.handlers))
+    for i, h in enumerate(logger.handlers):
+        _DEBUG.info("[DEBUG setup_logger] Handler %d: %s, level: %s", i, type(h).__name__, h.level)
+        if isinstance(h, _HANDLERS_ARCHIVO):
+            _DEBUG.info("[DEBUG setup_logger] Handler %d archivo: %s", i, h.baseFilename)
 
 
 def setup_logger(name: str, level: int = logging.INFO, 
@@ -427,52 +889,48 @@ def setup_logger(name: str, level: int = logging.INFO,
     logger = logging.getLogger(name)
     # Usar DEBUG como nivel mínimo para capturar TODOS los logs
     logger.setLevel(logging.DEBUG)
+    # Una reconfiguración explícita invalida el atajo de get_logger
+    _CONFIGURED.pop(name, None)
     
     # Debug: Log para verificar qué handlers tiene el logger antes de configurar
-    try:
-        debug_logger = logging.getLogger("LoggerDebug")
-        if not debug_logger.handlers:
-            debug_logger.addHandler(logging.StreamHandler())
-        debug_logger.info(f"[DEBUG setup_logger] Logger '{name}' - handlers antes de configurar: {len(logger.handlers)}")
-        for i, h in enumerate(logger.handlers):
-            debug_logger.info(f"[DEBUG setup_logger] Handler {i}: {type(h).__name__}, level: {h.level}")
-            if isinstance(h, logging.FileHandler) and hasattr(h, 'baseFilename'):
-                debug_logger.info(f"[DEBUG setup_logger] Handler {i} archivo: {h.baseFilename}")
-    except Exception:
-        pass
+    if __debug__ and _DEBUG_ON:
+        _log_handlers_debug(name, logger, "antes de configurar")
     
-    # Siempre limpiar handlers de archivo existentes para reconfigurar
-    # Esto asegura que se usen las rutas correctas y que ambos archivos reciban todos los logs
-    # IMPORTANTE: Siempre remover y reconfigurar para asegurar que ambos archivos tengan todos los logs
-    handlers_a_remover = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    # Rutas que el logger debe tener tras configurar (automáticas + archivo adicional)
+    rutas_destino = {
+        _ruta_absoluta(ruta) for _, ruta in _resolver_archivos_automaticos(logs_config, ruta_base)
+    }
+    if log_file:
+        rutas_destino.add(_ruta_absoluta(log_file))
+    
+    # Una sola pasada por los handlers: conservar los de archivo que ya apuntan a una
+    # ruta destino (evita cerrar y reabrir archivos), marcar los obsoletos y detectar consola
+    rutas = _rutas_handlers(logger)
+    handlers_a_remover = []
+    tiene_consola = False
+    for handler in logger.handlers:
+        if isinstance(handler, _HANDLERS_ARCHIVO):
+            if handler.baseFilename in rutas_destino and handler.baseFilename in rutas:
+                handler.setLevel(logging.DEBUG)
+            else:
+                handlers_a_remover.append(handler)
+        elif isinstance(handler, logging.StreamHandler):
+            tiene_consola = True
     for handler in handlers_a_remover:
         # Cerrar el handler para asegurar que se escriban todos los logs pendientes
         handler.flush()
         handler.close()
         logger.removeHandler(handler)
-    try:
-        debug_logger = logging.getLogger("LoggerDebug")
-        if not debug_logger.handlers:
-            debug_logger.addHandler(logging.StreamHandler())
-        debug_logger.info(f"[DEBUG setup_logger] Removidos {len(handlers_a_remover)} FileHandlers existentes para reconfigurar")
-    except Exception:
-        pass
-    
-    # Evitar duplicar handlers básicos (consola)
-    tiene_consola = any(isinstance(h, logging.StreamHandler) for h in logger.handlers)
+        rutas.discard(handler.baseFilename)
+    if __debug__ and _DEBUG_ON:
+        _DEBUG.info("[DEBUG setup_logger] Removidos %d FileHandlers obsoletos", len(handlers_a_remover))
     
-    # Formato estándar para consola
-    formatter_consola = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Handler para consola (solo si no tiene uno)
+    # Handler para consola (solo si no tiene uno y hay una consola que lo lea)
     # Usar DEBUG como nivel mínimo para capturar todos los logs
-    if not tiene_consola:
+    if not tiene_consola and _consola_habilitada():
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.DEBUG)
-        console_handler.setFormatter(formatter_consola)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         logger.addHandler(console_handler)
     
     # Configurar handlers automáticos (normaliza internamente)
@@ -480,39 +938,26 @@ def setup_logger(name: str, level: int = logging.INFO,
     _configurar_handlers_automaticos(logger, logs_config, ruta_base)
     
     # Debug: Log para verificar qué handlers tiene el logger después de configurar
-    try:
-        debug_logger = logging.getLogger("LoggerDebug")
-        if not debug_logger.handlers:
-            debug_logger.addHandler(logging.StreamHandler())
-        debug_logger.info(f"[DEBUG setup_logger] Logger '{name}' - handlers después de configurar: {len(logger.handlers)}")
-        for i, h in enumerate(logger.handlers):
-            debug_logger.info(f"[DEBUG setup_logger] Handler {i}: {type(h).__name__}, level: {h.level}")
-            if isinstance(h, logging.FileHandler) and hasattr(h, 'baseFilename'):
-                debug_logger.info(f"[DEBUG setup_logger] Handler {i} archivo: {h.baseFilename}")
-    except Exception:
-        pass
+    if __debug__ and _DEBUG_ON:
+        _log_handlers_debug(name, logger, "después de configurar")
     
     # Handler para archivo adicional (opcional, si se proporciona)
     if log_file:
         # Verificar si ya tiene este handler
-        tiene_handler_archivo = any(
-            isinstance(h, logging.FileHandler) and
-            hasattr(h, 'baseFilename') and
-            os.path.abspath(h.baseFilename) == os.path.abspath(log_file)
-            for h in logger.handlers
-        )
+        log_file_abs = _ruta_absoluta(log_file)
+        rutas = _rutas_handlers(logger)
         
-        if not tiene_handler_archivo:
+        if log_file_abs not in rutas:
             # Crear directorio si no existe
-            log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir, exist_ok=True)
+            _asegurar_directorio(os.path.dirname(log_file))
             
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            # Buffer de escritura de 64 KiB (flush con ERROR, periódico y al cerrar)
+            file_handler = _BufferedFileHandler(log_file, encoding='utf-8', delay=True)
+            file_handler.setFormatter(_CONSOLE_FORMATTER)  # Usar formato de consola para archivos adicionales
             # El handler debe tener nivel DEBUG para capturar todos los mensajes del nivel configurado
             file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter_consola)  # Usar formato de consola para archivos adicionales
             logger.addHandler(file_handler)
+            rutas.add(log_file_abs)
     
     return logger
 
@@ -529,6 +974,8 @@ def establecer_configuracion_global(logs_config: Optional[Dict[str, Any]], ruta_
     global _logs_config_global, _ruta_base_global
     _logs_config_global = logs_config
     _ruta_base_global = ruta_base
+    # Los loggers deben revisarse contra la nueva configuración
+    _CONFIGURED.clear()
 
 # Alias para compatibilidad (mantener nombre privado también disponible)
 _establecer_configuracion_global = establecer_configuracion_global
@@ -579,18 +1026,66 @@ def get_logger(name: str, logs_config: Optional[Dict[str, Any]] = None, ruta_bas
         ruta_base = _ruta_base_global
     
     logger = logging.getLogger(name)
+    fecha = _fecha_actual()
+    
+    # Atajo: el logger ya fue configurado con esta misma configuración hoy
+    configurado = _CONFIGURED.get(name)
+    if (configurado is not None and logger.handlers and configurado[0] is logs_config
+            and configurado[1] == ruta_base and configurado[2] == fecha):
+        return logger
     
     # Siempre configurar handlers (con configuración explícita, global, o por defecto)
     # Esto asegura que todos los logs se capturen desde el inicio
     if not logger.handlers:
-        return setup_logger(name, logs_config=logs_config, ruta_base=ruta_base)
+        logger = setup_logger(name, logs_config=logs_config, ruta_base=ruta_base)
     else:
         # Si ya tiene handlers, asegurar que tenga los handlers automáticos con la configuración actual
         _configurar_handlers_automaticos(logger, logs_config, ruta_base)
     
+    _CONFIGURED[name] = (logs_config, ruta_base, fecha)
     return logger
 
 
+@lru_cache(maxsize=32)
+def _obtener_logger_principal(name: str) -> logging.Logger:
+    """
+    Retorna el logger principal de un módulo, configurándolo solo si aún no tiene handlers.
+    
+    Memoizado por nombre: los loggers de logging son únicos por nombre y, una vez
+    obtenido (y configurado si hacía falta), se reutiliza sin repetir la consulta.
+    
+    Args:
+        name: Nombre del logger principal
+        
+    Returns:
+        Logger principal
+    """
+    main_logger = logging.getLogger(name)
+    if not main_logger.handlers:
+        main_logger = get_logger(name)
+    return main_logger
+
+
+def _informar_logger_principal(name: str, level: int, msg: str, *args: Any) -> bool:
+    """
+    Registra un mensaje en el logger principal sin propagar errores del logging.
+    
+    Args:
+        name: Nombre del logger principal
+        level: Nivel del mensaje
+        msg: Mensaje con formato %
+        *args: Argumentos del mensaje
+        
+    Returns:
+        True si se pudo registrar, False si falló
+    """
+    try:
+        _obtener_logger_principal(name).log(level, msg, *args)
+        return True
+    except Exception:
+        return False
+
+
 def configurar_loggers(config_dict: Optional[Dict[str, Any]] = None, module_name: str = "Module", 
                        main_logger_name: Optional[str] = None, ruta_base: Optional[str] = None) -> Dict[str, logging.Logger]:
     """
@@ -661,13 +1156,7 @@ def configurar_loggers(config_dict: Optional[Dict[str, Any]] = None, module_name
             logger_auditoria = setup_logger(logger_name_auditoria, level=logging.INFO, log_file=log_auditoria_file)
             loggers["auditoria"] = logger_auditoria
             # Usar el logger principal para informar
-            try:
-                main_logger = logging.getLogger(main_logger_name)
-                if not main_logger.handlers:
-                    main_logger = get_logger(main_logger_name)
-                main_logger.info(f"Logger de auditoría configurado: {log_auditoria_file}")
-            except Exception:
-                pass  # Si no se puede usar el logger principal, continuar
+            _informar_logger_principal(main_logger_name, logging.INFO, "Logger de auditoría configurado: %s", log_auditoria_file)
         
         # Configurar logger de sistema/errores
         sistema_config = logs_config.get("sistema", {})
@@ -681,21 +1170,10 @@ def configurar_loggers(config_dict: Optional[Dict[str, Any]] = None, module_name
             logger_sistema = setup_logger(logger_name_sistema, level=logging.ERROR, log_file=log_sistema_file)
             loggers["sistema"] = logger_sistema
             # Usar el logger principal para informar
-            try:
-                main_logger = logging.getLogger(main_logger_name)
-                if not main_logger.handlers:
-                    main_logger = get_logger(main_logger_name)
-                main_logger.info(f"Logger de sistema/errores configurado: {log_sistema_file}")
-            except Exception:
-                pass  # Si no se puede usar el logger principal, continuar
+            _informar_logger_principal(main_logger_name, logging.INFO, "Logger de sistema/errores configurado: %s", log_sistema_file)
     except Exception as e:
         # Intentar usar el logger principal, si no existe crear uno básico
-        try:
-            main_logger = logging.getLogger(main_logger_name)
-            if not main_logger.handlers:
-                main_logger = get_logger(main_logger_name)
-            main_logger.warning(f"No se pudieron configurar los loggers físicos: {e}")
-        except Exception:
+        if not _informar_logger_principal(main_logger_name, logging.WARNING, "No se pudieron configurar los loggers físicos: %s", e):
             print(f"Error al configurar loggers: {e}")
     
     return loggers
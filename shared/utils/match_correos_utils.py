@@ -10,9 +10,12 @@ Inspirado en MathCorreos.py, implementa:
 """
 
 import re
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 from rapidfuzz import fuzz, process
 from shared.utils.logger import get_logger
+from shared.utils._norm_fast import HAS_NUMBA, es_apto, normalizar_basico_lote
 
 logger = get_logger(__name__)
 
@@ -103,6 +106,86 @@ NUMEROS_LETRAS = {
     "TREINTA": "30",
 }
 
+# Máximo de listas de entidades cacheadas por matcher
+_MAX_LISTAS_CACHEADAS = 16
+
+# Tamaño mínimo de lista para usar el kernel Numba (compensa el costo del JIT)
+_MIN_LOTE_NUMBA = 1000
+
+# Consultas por llamada a process.cdist en comparar_entidades_en_lote: con 100K
+# entidades, un bloque de 1024 filas float32 ocupa ~400 MB en lugar de la matriz completa
+_FILAS_POR_BLOQUE = 1024
+
+# Patrones compilados una sola vez
+_DUP_DIGIT_RE = re.compile(r"\b(\d+)(\s+\1)+\b")
+_MULTISPACE_RE = re.compile(r"\s+")
+_EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+
+# Tabla de acentos (sobre texto ya en mayúsculas) para str.translate
+_ACCENT_TABLE = str.maketrans({
+    "Á": "A",
+    "É": "E",
+    "Í": "I",
+    "Ó": "O",
+    "Ú": "U",
+    "Ñ": "N",
+    "À": "A",
+    "È": "E",
+    "Ì": "I",
+    "Ò": "O",
+    "Ù": "U",
+})
+
+# Números escritos ordenados una sola vez al importar (más largos primero)
+_NUMEROS_SORTED = tuple(sorted(NUMEROS_LETRAS.items(), key=lambda kv: len(kv[0]), reverse=True))
+
+# Una sola alternancia para todos los números escritos, en el orden de _NUMEROS_SORTED
+_NUM_RE = re.compile(
+    r"\b(" + "|".join(re.escape(palabra) for palabra, _ in _NUMEROS_SORTED) + r")\b"
+)
+
+
+def _reemplazar_numero(match: "re.Match") -> str:
+    """Retorna el dígito correspondiente a un número escrito encontrado por _NUM_RE."""
+    return NUMEROS_LETRAS[match.group(1)]
+
+
+def _ordenar_tokens(texto: str) -> str:
+    """Ordena los tokens de un texto (forma usada por token_sort_ratio)."""
+    return " ".join(sorted(texto.split()))
+
+
+def _indexar_entidades(
+    entidades_bd: List[Tuple[str, str]]
+) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Separa los nombres de entidades y agrupa sus correos por nombre.
+
+    Args:
+        entidades_bd: Lista de tuplas (nombre_entidad, correo_electronico).
+
+    Returns:
+        Tupla (nombres en orden, dict nombre -> lista de cadenas de correos).
+    """
+    nombres = []
+    correos_por_nombre: Dict[str, List[str]] = defaultdict(list)
+    for nombre, correos_str in entidades_bd:
+        nombres.append(nombre)
+        correos_por_nombre[nombre].append(correos_str)
+    return nombres, dict(correos_por_nombre)
+
+
+def _resultado_error_correos(error: str) -> Dict:
+    """Resultado de comparar_entidades_con_probabilidad ante una excepción."""
+    return {
+        "success": False,
+        "entity_matched": None,
+        "emails": [],
+        "similarity_score": 0.0,
+        "metadata": {},
+        "error": error,
+    }
+
 
 class EntityMatcher:
     """
@@ -120,7 +203,104 @@ class EntityMatcher:
 
     def __init__(self):
         """Inicializa el matcher de entidades."""
-        pass
+        # id(lista) -> (copia de la lista, valor derivado); evita renormalizar la BD por consulta
+        self._norm_cache: Dict[int, Tuple[list, Any]] = {}
+        self._nombres_cache: Dict[int, Tuple[list, Any]] = {}
+
+    @staticmethod
+    def _derivado_cacheado(
+        cache: Dict[int, Tuple[list, Any]], lista: list, construir: Callable[[list], Any]
+    ) -> Any:
+        """
+        Retorna un valor derivado de una lista, reutilizándolo mientras la lista no cambie.
+
+        La clave es id(lista); la copia guardada se compara con la lista actual para
+        detectar modificaciones o un id reutilizado (comparación por identidad de
+        elementos, mucho más barata que volver a derivar).
+
+        Args:
+            cache: Diccionario de caché del matcher.
+            lista: Lista de origen.
+            construir: Función que calcula el valor derivado.
+
+        Returns:
+            Valor derivado de la lista.
+        """
+        entrada = cache.get(id(lista))
+        if entrada is not None and entrada[0] == lista:
+            return entrada[1]
+        if len(cache) >= _MAX_LISTAS_CACHEADAS:
+            cache.clear()
+        valor = construir(lista)
+        cache[id(lista)] = (list(lista), valor)
+        return valor
+
+    def preparar_entidades(self, lista_entidades: List[str]) -> List[str]:
+        """
+        Normaliza una lista de entidades, cacheando el resultado para consultas repetidas.
+
+        Args:
+            lista_entidades: Lista de nombres de entidades en BD.
+
+        Returns:
+            Lista de nombres normalizados (no modificar).
+        """
+        return self._entidades_preparadas(lista_entidades)[0]
+
+    def _entidades_preparadas(self, lista_entidades: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Retorna (normalizadas, con_tokens_ordenados) para una lista de entidades.
+
+        Las cadenas con tokens ordenados permiten usar fuzz.ratio con el mismo
+        resultado que fuzz.token_sort_ratio sin reordenar cada candidato por consulta.
+
+        Args:
+            lista_entidades: Lista de nombres de entidades en BD.
+
+        Returns:
+            Tupla de listas paralelas (no modificar).
+        """
+        return self._derivado_cacheado(
+            self._norm_cache, lista_entidades, self._preparar_lista
+        )
+
+    def _preparar_lista(self, lista_entidades: List[str]) -> Tuple[List[str], List[str]]:
+        """Normaliza la lista y construye la versión con tokens ordenados."""
+        if HAS_NUMBA and len(lista_entidades) >= _MIN_LOTE_NUMBA:
+            normalizadas = self._normalizar_lote(lista_entidades)
+        else:
+            normalizadas = [self.normalize_text(e) for e in lista_entidades]
+        ordenadas = [_ordenar_tokens(e) for e in normalizadas]
+        return normalizadas, ordenadas
+
+    def _normalizar_lote(self, textos: List[str]) -> List[str]:
+        """
+        Normaliza muchos textos usando el kernel Numba para la parte por caracteres.
+
+        Los textos aptos (ASCII o con los acentos soportados) pasan juntos por el
+        kernel (mayúsculas, acentos, espacios) y luego por las regex de números;
+        el resto usa normalize_text. El resultado es idéntico a normalize_text.
+
+        Args:
+            textos: Textos a normalizar.
+
+        Returns:
+            Textos normalizados, en el mismo orden.
+        """
+        resultado = [""] * len(textos)
+        indices_aptos = []
+        aptos = []
+        for i, texto in enumerate(textos):
+            if isinstance(texto, str) and es_apto(texto):
+                indices_aptos.append(i)
+                aptos.append(texto)
+            else:
+                resultado[i] = self.normalize_text(texto)
+
+        for i, texto in zip(indices_aptos, normalizar_basico_lote(aptos)):
+            texto = _NUM_RE.sub(_reemplazar_numero, texto)
+            resultado[i] = _DUP_DIGIT_RE.sub(r"\1", texto)
+        return resultado
 
     def normalize_text(self, text: str) -> str:
         """
@@ -139,38 +319,46 @@ class EntityMatcher:
         """
         if not isinstance(text, str):
             return ""
+        return self._normalize_text_cached(text)
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _normalize_text_cached(text: str) -> str:
+        """
+        Implementación memoizada de normalize_text (no depende del estado de la instancia).
+
+        Los nombres de entidades (juzgados, departamentos) se repiten mucho entre
+        consultas y listas de BD; un acierto de caché evita todo el pipeline.
 
+        Args:
+            text: Texto a normalizar (str).
+
+        Returns:
+            Texto normalizado.
+        """
         # Mayúsculas
         text = text.upper()
 
+        # Atajo: texto ASCII de palabras alfanuméricas sin números escritos ni
+        # dígitos repetidos consecutivos; solo falta colapsar espacios
+        if text.isascii():
+            tokens = text.split()
+            if all(t.isalnum() and t not in NUMEROS_LETRAS for t in tokens) and not any(
+                a == b and a.isdigit() for a, b in zip(tokens, tokens[1:])
+            ):
+                return " ".join(tokens)
+
         # Eliminar acentos
-        replacements = {
-            "Á": "A",
-            "É": "E",
-            "Í": "I",
-            "Ó": "O",
-            "Ú": "U",
-            "Ñ": "N",
-            "À": "A",
-            "È": "E",
-            "Ì": "I",
-            "Ò": "O",
-            "Ù": "U",
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        text = text.translate(_ACCENT_TABLE)
 
-        # Reemplazar números escritos por dígitos (ordenar por longitud desc)
-        for palabra, numero in sorted(
-            NUMEROS_LETRAS.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            text = re.sub(rf"\b{palabra}\b", numero, text)
+        # Reemplazar números escritos por dígitos en una sola pasada
+        text = _NUM_RE.sub(_reemplazar_numero, text)
 
         # Eliminar duplicados de números consecutivos (ej: "2 2" -> "2")
-        text = re.sub(r"\b(\d+)(\s+\1)+\b", r"\1", text)
+        text = _DUP_DIGIT_RE.sub(r"\1", text)
 
         # Eliminar espacios múltiples
-        text = re.sub(r"\s+", " ", text)
+        text = _MULTISPACE_RE.sub(" ", text)
 
         return text.strip()
 
@@ -191,7 +379,7 @@ class EntityMatcher:
             nombre_consulta: Nombre de la entidad a buscar.
             lista_entidades: Lista de nombres de entidades en BD.
             threshold: Umbral de similitud (0.0 a 1.0).
-            top_n: Número de mejores coincidencias a considerar.
+            top_n: Se conserva por compatibilidad; solo se usa la mejor coincidencia.
 
         Returns:
             Dict con:
@@ -214,15 +402,22 @@ class EntityMatcher:
             # Normalizar consulta
             nombre_norm = self.normalize_text(nombre_consulta)
 
-            # Normalizar lista de entidades
-            entidades_norm = [self.normalize_text(e) for e in lista_entidades]
-
-            # Buscar coincidencias usando rapidfuzz
-            matches = process.extract(
-                nombre_norm, entidades_norm, scorer=fuzz.token_sort_ratio, limit=top_n
+            # Normalizar lista de entidades (cacheada entre consultas)
+            entidades_norm, entidades_ordenadas = self._entidades_preparadas(lista_entidades)
+
+            # Buscar la mejor coincidencia usando rapidfuzz. Con los tokens ya ordenados,
+            # fuzz.ratio equivale a token_sort_ratio sin reordenar cada candidato.
+            # extractOne usa el mejor score parcial como corte para el resto de
+            # candidatos; no se fija score_cutoff para poder informar el mejor
+            # candidato aunque quede bajo el threshold
+            mejor = process.extractOne(
+                _ordenar_tokens(nombre_norm),
+                entidades_ordenadas,
+                scorer=fuzz.ratio,
+                processor=None,
             )
 
-            if not matches:
+            if mejor is None:
                 logger.warning(
                     f"No se encontraron coincidencias para: {nombre_consulta}"
                 )
@@ -235,38 +430,12 @@ class EntityMatcher:
                 }
 
             # Obtener la mejor coincidencia
-            mejor_match_norm, score, index = matches[0]
-            score_normalized = score / 100.0
-
-            # Validar contra el threshold
-            if score_normalized < threshold:
-                logger.warning(
-                    f"Score {score_normalized:.2f} < threshold {threshold} "
-                    f"para {nombre_consulta}"
-                )
-                return {
-                    "success": False,
-                    "entity_matched": lista_entidades[index],
-                    "similarity_score": score_normalized,
-                    "normalized_query": nombre_norm,
-                    "normalized_match": mejor_match_norm,
-                    "error": f"Score bajo: {score_normalized:.2%}",
-                }
-
-            logger.info(
-                f"Coincidencia encontrada: '{nombre_consulta}' -> "
-                f"'{lista_entidades[index]}' (score: {score_normalized:.2%})"
+            _, score, index = mejor
+            return self._resultado_coincidencia(
+                nombre_consulta, nombre_norm, lista_entidades, entidades_norm,
+                score, index, threshold,
             )
 
-            return {
-                "success": True,
-                "entity_matched": lista_entidades[index],
-                "similarity_score": score_normalized,
-                "normalized_query": nombre_norm,
-                "normalized_match": mejor_match_norm,
-                "error": None,
-            }
-
         except Exception as e:
             logger.error(f"Error en búsqueda de coincidencia: {str(e)}")
             return {
@@ -276,6 +445,63 @@ class EntityMatcher:
                 "error": str(e),
             }
 
+    def _resultado_coincidencia(
+        self,
+        nombre_consulta: str,
+        nombre_norm: str,
+        lista_entidades: List[str],
+        entidades_norm: List[str],
+        score: float,
+        index: int,
+        threshold: float,
+    ) -> Dict:
+        """
+        Arma el resultado de buscar_mejor_coincidencia a partir del mejor candidato.
+
+        Args:
+            nombre_consulta: Nombre de la entidad buscada.
+            nombre_norm: Consulta normalizada.
+            lista_entidades: Lista de nombres de entidades en BD.
+            entidades_norm: Lista normalizada paralela a lista_entidades.
+            score: Score del mejor candidato (0 a 100).
+            index: Posición del mejor candidato.
+            threshold: Umbral de similitud (0.0 a 1.0).
+
+        Returns:
+            Dict con el mismo formato que buscar_mejor_coincidencia.
+        """
+        mejor_match_norm = entidades_norm[index]
+        score_normalized = score / 100.0
+
+        # Validar contra el threshold
+        if score_normalized < threshold:
+            logger.warning(
+                f"Score {score_normalized:.2f} < threshold {threshold} "
+                f"para {nombre_consulta}"
+            )
+            return {
+                "success": False,
+                "entity_matched": lista_entidades[index],
+                "similarity_score": score_normalized,
+                "normalized_query": nombre_norm,
+                "normalized_match": mejor_match_norm,
+                "error": f"Score bajo: {score_normalized:.2%}",
+            }
+
+        logger.info(
+            f"Coincidencia encontrada: '{nombre_consulta}' -> "
+            f"'{lista_entidades[index]}' (score: {score_normalized:.2%})"
+        )
+
+        return {
+            "success": True,
+            "entity_matched": lista_entidades[index],
+            "similarity_score": score_normalized,
+            "normalized_query": nombre_norm,
+            "normalized_match": mejor_match_norm,
+            "error": None,
+        }
+
     def parsear_correos(self, correos_str: str) -> List[str]:
         """
         Parsea string de correos separados por comas.
@@ -289,18 +515,17 @@ class EntityMatcher:
         if not correos_str or not isinstance(correos_str, str):
             return []
 
-        # Separar por comas y limpiar espacios
-        correos = [email.strip() for email in correos_str.split(",")]
+        # Separar por comas, limpiar espacios y descartar vacíos
+        correos = [email for raw in correos_str.split(",") if (email := raw.strip())]
 
-        # Filtrar correos vacíos y validar formato básico
-        correos_validos = []
-        email_pattern = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+        # Validar formato básico
+        correos_validos = [email for email in correos if _EMAIL_RE.match(email)]
 
-        for email in correos:
-            if email and email_pattern.match(email):
-                correos_validos.append(email)
-            elif email:
-                logger.warning(f"Correo inválido detectado: {email}")
+        # Solo si hubo descartes se recorren de nuevo para informarlos
+        if len(correos_validos) != len(correos):
+            for email in correos:
+                if not _EMAIL_RE.match(email):
+                    logger.warning(f"Correo inválido detectado: {email}")
 
         return correos_validos
 
@@ -334,60 +559,193 @@ class EntityMatcher:
                 - error: str (si falla)
         """
         try:
-            # Extraer solo los nombres para matching
-            nombres = [tupla[0] for tupla in entidades_bd]
+            # Extraer los nombres para matching y el índice nombre -> correos (mismos
+            # objetos mientras la BD no cambie, para reutilizar la normalización cacheada)
+            nombres, correos_por_nombre = self._derivado_cacheado(
+                self._nombres_cache, entidades_bd, _indexar_entidades
+            )
 
             # Buscar mejor coincidencia
             resultado = self.buscar_mejor_coincidencia(
                 entidad_consulta, nombres, threshold
             )
+            return self._resultado_con_correos(
+                entidad_consulta, resultado, correos_por_nombre
+            )
 
-            if not resultado["success"]:
-                return {
-                    "success": False,
-                    "entity_matched": resultado.get("entity_matched"),
-                    "emails": [],
-                    "similarity_score": resultado["similarity_score"],
-                    "metadata": resultado,
-                    "error": resultado["error"],
-                }
-
-            # Encontrar los correos de la entidad coincidente
-            entity_matched = resultado["entity_matched"]
-            correos_encontrados = []
-
-            for nombre, correos_str in entidades_bd:
-                if nombre == entity_matched:
-                    correos = self.parsear_correos(correos_str)
-                    correos_encontrados.extend(correos)
+        except Exception as e:
+            logger.error(f"Error comparando entidades: {str(e)}")
+            return _resultado_error_correos(str(e))
 
-            # Eliminar duplicados manteniendo orden
-            correos_unicos = list(dict.fromkeys(correos_encontrados))
+    def _resultado_con_correos(
+        self,
+        entidad_consulta: str,
+        resultado: Dict,
+        correos_por_nombre: Dict[str, List[str]],
+    ) -> Dict:
+        """
+        Completa el resultado de una búsqueda con los correos de la entidad encontrada.
 
-            logger.info(
-                f"Entidad '{entidad_consulta}' -> '{entity_matched}': "
-                f"{len(correos_unicos)} correo(s) encontrado(s)"
-            )
+        Args:
+            entidad_consulta: Nombre de entidad buscada.
+            resultado: Resultado de buscar_mejor_coincidencia.
+            correos_por_nombre: Índice nombre -> cadenas de correos.
 
+        Returns:
+            Dict con el formato de comparar_entidades_con_probabilidad.
+        """
+        if not resultado["success"]:
             return {
-                "success": True,
-                "entity_matched": entity_matched,
-                "emails": correos_unicos,
+                "success": False,
+                "entity_matched": resultado.get("entity_matched"),
+                "emails": [],
                 "similarity_score": resultado["similarity_score"],
-                "metadata": {
-                    "normalized_query": resultado["normalized_query"],
-                    "normalized_match": resultado["normalized_match"],
-                },
-                "error": None,
+                "metadata": resultado,
+                "error": resultado["error"],
             }
 
+        # Encontrar los correos de la entidad coincidente
+        entity_matched = resultado["entity_matched"]
+        correos_encontrados = []
+
+        for correos_str in correos_por_nombre.get(entity_matched, ()):
+            correos_encontrados.extend(self.parsear_correos(correos_str))
+
+        # Eliminar duplicados manteniendo orden
+        vistos = set()
+        correos_unicos = [
+            c for c in correos_encontrados if not (c in vistos or vistos.add(c))
+        ]
+
+        logger.info(
+            f"Entidad '{entidad_consulta}' -> '{entity_matched}': "
+            f"{len(correos_unicos)} correo(s) encontrado(s)"
+        )
+
+        return {
+            "success": True,
+            "entity_matched": entity_matched,
+            "emails": correos_unicos,
+            "similarity_score": resultado["similarity_score"],
+            "metadata": {
+                "normalized_query": resultado["normalized_query"],
+                "normalized_match": resultado["normalized_match"],
+            },
+            "error": None,
+        }
+
+    def comparar_entidades_en_lote(
+        self,
+        entidades_consulta: List[str],
+        entidades_bd: List[Tuple[str, str]],
+        threshold: float = 0.75,
+    ) -> List[Dict]:
+        """
+        Compara muchas entidades contra la BD con una matriz de scores por bloques.
+
+        Equivale a llamar comparar_entidades_con_probabilidad por cada consulta, pero
+        calcula todos los scores con rapidfuzz.process.cdist (en C, multihilo y sin GIL).
+
+        Args:
+            entidades_consulta: Nombres de entidades a buscar.
+            entidades_bd: Lista de tuplas (nombre_entidad, correo_electronico).
+            threshold: Umbral de similitud.
+
+        Returns:
+            Lista de dicts con el formato de comparar_entidades_con_probabilidad,
+            en el mismo orden que entidades_consulta.
+        """
+        try:
+            nombres, correos_por_nombre = self._derivado_cacheado(
+                self._nombres_cache, entidades_bd, _indexar_entidades
+            )
+            if not nombres or not entidades_consulta:
+                # Sin BD: cada consulta retorna el error estándar de lista vacía
+                return [
+                    self.comparar_entidades_con_probabilidad(c, entidades_bd, threshold)
+                    for c in entidades_consulta
+                ]
+
+            entidades_norm, entidades_ordenadas = self._entidades_preparadas(nombres)
+            consultas_norm = [self.normalize_text(c) for c in entidades_consulta]
+            consultas_ordenadas = [_ordenar_tokens(c) for c in consultas_norm]
+
+            # Mejor índice por consulta, calculando la matriz por bloques de filas
+            # (_FILAS_POR_BLOQUE x N) para acotar la memoria. Con tokens ordenados,
+            # fuzz.ratio equivale a token_sort_ratio
+            mejores: List[int] = []
+            for inicio in range(0, len(consultas_ordenadas), _FILAS_POR_BLOQUE):
+                scores = process.cdist(
+                    consultas_ordenadas[inicio:inicio + _FILAS_POR_BLOQUE],
+                    entidades_ordenadas,
+                    scorer=fuzz.ratio,
+                    processor=None,
+                    workers=-1,
+                )
+                mejores.extend(int(fila.argmax()) for fila in scores)
+
+            resultados = []
+            for i, consulta in enumerate(entidades_consulta):
+                if not consulta:
+                    # Misma respuesta de consulta vacía que la búsqueda individual
+                    resultado = self.buscar_mejor_coincidencia(consulta, nombres, threshold)
+                else:
+                    index = mejores[i]
+                    # Recalcular el score exacto (cdist retorna float32)
+                    score = fuzz.ratio(consultas_ordenadas[i], entidades_ordenadas[index])
+                    resultado = self._resultado_coincidencia(
+                        consulta, consultas_norm[i], nombres, entidades_norm,
+                        score, index, threshold,
+                    )
+                resultados.append(
+                    self._resultado_con_correos(consulta, resultado, correos_por_nombre)
+                )
+            return resultados
+
         except Exception as e:
-            logger.error(f"Error comparando entidades: {str(e)}")
-            return {
-                "success": False,
-                "entity_matched": None,
-                "emails": [],
-                "similarity_score": 0.0,
-                "metadata": {},
-                "error": str(e),
-            }
+            logger.error(f"Error comparando entidades en lote: {str(e)}")
+            return [_resultado_error_correos(str(e)) for _ in entidades_consulta]
+
+
+# Instancia compartida por el proceso: sus cachés de listas preparadas sobreviven
+# entre llamadas en lugar de perderse con cada EntityMatcher() nuevo
+_DEFAULT_MATCHER = EntityMatcher()
+
+
+def normalize_text(text: str) -> str:
+    """Atajo de EntityMatcher.normalize_text sobre la instancia compartida."""
+    return _DEFAULT_MATCHER.normalize_text(text)
+
+
+def buscar_mejor_coincidencia(
+    nombre_consulta: str,
+    lista_entidades: List[str],
+    threshold: float = 0.75,
+    top_n: int = 3,
+) -> Dict:
+    """Atajo de EntityMatcher.buscar_mejor_coincidencia sobre la instancia compartida."""
+    return _DEFAULT_MATCHER.buscar_mejor_coincidencia(
+        nombre_consulta, lista_entidades, threshold, top_n
+    )
+
+
+def comparar_entidades_con_probabilidad(
+    entidad_consulta: str,
+    entidades_bd: List[Tuple[str, str]],
+    threshold: float = 0.75,
+) -> Dict:
+    """Atajo de EntityMatcher.comparar_entidades_con_probabilidad sobre la instancia compartida."""
+    return _DEFAULT_MATCHER.comparar_entidades_con_probabilidad(
+        entidad_consulta, entidades_bd, threshold
+    )
+
+
+def comparar_entidades_en_lote(
+    entidades_consulta: List[str],
+    entidades_bd: List[Tuple[str, str]],
+    threshold: float = 0.75,
+) -> List[Dict]:
+    """Atajo de EntityMatcher.comparar_entidades_en_lote sobre la instancia compartida."""
+    return _DEFAULT_MATCHER.comparar_entidades_en_lote(
+        entidades_consulta, entidades_bd, threshold
+    )
@@ -5,13 +5,16 @@ Módulo con funciones helper para operaciones comunes con Playwright async API,
 inspirado en web_scraping_utils.py pero adaptado para Playwright.
 """
 
-from typing import Optional
-from playwright.async_api import Page, Browser, BrowserContext, TimeoutError
+from typing import FrozenSet, Optional
+from playwright.async_api import Page, Browser, BrowserContext, Route, TimeoutError
 
 from shared.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Tipos de recurso que no aportan al scraping y se bloquean por defecto
+_RECURSOS_BLOQUEADOS = frozenset({"image", "font", "media"})
+
 
 class PlaywrightUtility:
     """Clase utilitaria para manejar operaciones de Playwright de manera genérica."""
@@ -34,6 +37,32 @@ class PlaywrightUtility:
         self.browser = browser
         self.context = context
 
+    @staticmethod
+    async def enable_resource_blocking(
+        context: BrowserContext,
+        blocked: FrozenSet[str] = _RECURSOS_BLOQUEADOS,
+    ) -> None:
+        """
+        Bloquea en un contexto las peticiones de recursos no esenciales.
+
+        Registra una sola ruta "**/*" que aborta las peticiones cuyo resource_type
+        está en blocked y deja pasar el resto. Debe llamarse una vez por contexto,
+        antes de navegar.
+
+        Args:
+            context: BrowserContext de Playwright.
+            blocked: Tipos de recurso a bloquear ('image', 'font', 'media',
+                'stylesheet', ...).
+        """
+        async def _filtrar(route: Route) -> None:
+            if route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", _filtrar)
+        logger.info(f"Bloqueo de recursos activado: {', '.join(sorted(blocked))}")
+
     async def wait_for_element(
         self, selector: str, timeout: int = 10000, state: str = "visible"
     ) -> bool:
@@ -93,17 +122,9 @@ class PlaywrightUtility:
             return False
 
         try:
-            # Esperar a que el elemento sea clickeable
-            element = await self.page.wait_for_selector(
-                selector, timeout=timeout, state="visible"
-            )
-
-            if not element:
-                logger.error(f"Elemento no encontrado: {selector}")
-                return False
-
-            # Hacer clic
-            await element.click()
+            # page.click espera a que el elemento sea clickeable y hace clic
+            # en una sola llamada al navegador
+            await self.page.click(selector, timeout=timeout)
 
             desc_text = description or selector
             logger.info(f"Clic realizado en: {desc_text}")
@@ -136,7 +157,8 @@ class PlaywrightUtility:
         Args:
             selector: Selector del input.
             text: Texto a ingresar.
-            clear_first: Si debe limpiar el campo primero.
+            clear_first: Si debe limpiar el campo primero (page.fill siempre
+                reemplaza el contenido, se conserva por compatibilidad).
             timeout: Tiempo máximo de espera.
             description: Descripción del campo para logs.
 
@@ -148,21 +170,8 @@ class PlaywrightUtility:
             return False
 
         try:
-            # Esperar a que el elemento esté visible
-            element = await self.page.wait_for_selector(
-                selector, timeout=timeout, state="visible"
-            )
-
-            if not element:
-                logger.error(f"Input no encontrado: {selector}")
-                return False
-
-            # Limpiar si se especificó
-            if clear_first:
-                await element.fill("")
-
-            # Llenar con el texto
-            await element.fill(text)
+            # page.fill espera el input, lo limpia y lo llena en una sola llamada
+            await self.page.fill(selector, text, timeout=timeout)
 
             desc_text = description or selector
             logger.info(f"Texto ingresado en: {desc_text}")
@@ -196,15 +205,7 @@ class PlaywrightUtility:
             return None
 
         try:
-            element = await self.page.wait_for_selector(
-                selector, timeout=timeout, state="visible"
-            )
-
-            if not element:
-                logger.error(f"Elemento no encontrado: {selector}")
-                return None
-
-            text = await element.text_content()
+            text = await self.page.text_content(selector, timeout=timeout)
 
             desc_text = description or selector
             logger.info(f"Texto obtenido de: {desc_text}")
@@ -223,11 +224,14 @@ class PlaywrightUtility:
         self, selector: str, timeout: int = 5000
     ) -> bool:
         """
-        Verifica si un elemento está visible.
+        Verifica si un elemento está visible en este momento.
+
+        No espera a que aparezca: un elemento ausente retorna False de inmediato.
+        Para esperar su aparición usar wait_for_element.
 
         Args:
             selector: Selector del elemento.
-            timeout: Tiempo máximo de espera.
+            timeout: Sin efecto; se conserva por compatibilidad.
 
         Returns:
             True si el elemento está visible, False si no.
@@ -236,19 +240,13 @@ class PlaywrightUtility:
             return False
 
         try:
-            element = await self.page.wait_for_selector(
-                selector, timeout=timeout, state="visible"
-            )
-            return element is not None
-
-        except TimeoutError:
-            return False
+            return await self.page.locator(selector).is_visible()
 
         except Exception:
             return False
 
     async def wait_for_navigation(
-        self, timeout: int = 30000, wait_until: str = "networkidle"
+        self, timeout: int = 30000, wait_until: str = "domcontentloaded"
     ) -> bool:
         """
         Espera a que la navegación se complete.
@@ -256,6 +254,9 @@ class PlaywrightUtility:
         Args:
             timeout: Tiempo máximo de espera.
             wait_until: Evento a esperar ('load', 'networkidle', 'domcontentloaded').
+                Playwright desaconseja 'networkidle': espera 500 ms sin tráfico de
+                red, lo que en páginas con analítica o polling puede tardar hasta
+                el timeout. Usarlo solo de forma explícita.
 
         Returns:
             True si la navegación completó, False si hubo timeout.
@@ -336,13 +337,17 @@ class PlaywrightUtility:
         except Exception as e:
             logger.error(f"Error cerrando navegador: {str(e)}")
 
-    async def navigate_to(self, url: str, timeout: int = 30000) -> bool:
+    async def navigate_to(
+        self, url: str, timeout: int = 30000, wait_until: str = "domcontentloaded"
+    ) -> bool:
         """
         Navega a una URL específica.
 
         Args:
             url: URL a la que se desea navegar.
             timeout: Tiempo máximo de espera.
+            wait_until: Evento a esperar ('load', 'networkidle', 'domcontentloaded').
+                'networkidle' está desaconsejado por Playwright (ver wait_for_navigation).
 
         Returns:
             True si la navegación fue exitosa, False si hubo error.
@@ -353,7 +358,7 @@ class PlaywrightUtility:
 
         try:
             logger.info(f"Navegando a: {url}")
-            await self.page.goto(url, timeout=timeout, wait_until="networkidle")
+            await self.page.goto(url, timeout=timeout, wait_until=wait_until)
             logger.info(f"Navegación exitosa a: {url}")
             return True
 
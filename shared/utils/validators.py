@@ -7,6 +7,14 @@ import re
 from datetime import datetime
 from typing import Any, Optional
 
+# Patrones compilados una sola vez
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Clases de caracteres sin grupos envolventes: mismo lenguaje, menos transiciones
+_URL_RE = re.compile(r'^https?://[-\w.]+[:\d]*(?:/[\w/_.]*)?(?:\?[\w&=%.]*)?(?:#\w*)?$')
+
+# Tipos que float() siempre acepta, validados sin entrar al try/except
+_TIPOS_NUMERICOS = frozenset({int, float, bool})
+
 
 def validate_email(email: str) -> bool:
     """
@@ -22,8 +30,7 @@ def validate_email(email: str) -> bool:
         if validate_email("user@example.com"):
             print("Email válido")
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_url(url: str) -> bool:
@@ -40,8 +47,7 @@ def validate_url(url: str) -> bool:
         if validate_url("https://example.com"):
             print("URL válida")
     """
-    pattern = r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*)?(?:\?(?:[\w&=%.])*)?(?:#(?:\w*))?$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def validate_date(date_string: str, format_string: str = "%Y-%m-%d") -> bool:
@@ -74,15 +80,18 @@ def validate_not_empty(value: Any) -> bool:
         value: Valor a validar
     
     Returns:
-        True si no está vacío, False en caso contrario
+        True si no está vacío, False en caso contrario.
+        Los valores sin longitud (números, objetos) se consideran no vacíos.
     """
     if value is None:
         return False
     if isinstance(value, str):
-        return len(value.strip()) > 0
-    if isinstance(value, (list, dict, tuple)):
+        return bool(value.strip())
+    # Cualquier contenedor con longitud (list, dict, tuple, set, ...) se valida por len
+    try:
         return len(value) > 0
-    return True
+    except TypeError:
+        return True
 
 
 def validate_numeric(value: Any) -> bool:
@@ -95,6 +104,9 @@ def validate_numeric(value: Any) -> bool:
     Returns:
         True si es numérico, False en caso contrario
     """
+    # Atajo sin try/except para el caso común (int/float exactos, incluye bool vía float)
+    if type(value) in _TIPOS_NUMERICOS:
+        return True
     try:
         float(value)
         return True
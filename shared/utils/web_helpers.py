@@ -3,18 +3,419 @@
 Utilidades auxiliares para operaciones web y scraping.
 """
 
-from typing import Optional, List
+import asyncio
+import atexit
+import json
+import os
+import re
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, List, Tuple
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+)
 from shared.utils.logger import get_logger
 
 logger = get_logger("WebHelpers")
 
+# Elementos ya localizados, una caché LRU por driver guardada en el propio driver
+# (atributo _ELEMENT_CACHE_ATTR) para que se libere junto con él:
+# (id(parent), by, value) -> (parent, elemento). Se guarda el parent para verificar
+# identidad y no confundir ids reutilizados. El lock protege las cachés entre hilos
+_ELEMENT_CACHE_ATTR = "_ec_cc_elementos"
+_ELEMENT_CACHE_MAX = 4096
+_element_cache_lock = threading.Lock()
+_drivers_con_cache: "weakref.WeakSet" = weakref.WeakSet()
 
-def safe_find_text(parent: WebElement, by: By, value: str, default: str = "") -> str:
+# XPath simples convertibles a CSS: [.]//tag o [.]//tag[@attr='valor']
+_XPATH_SIMPLE_RE = re.compile(r"""^(\.?)//(\w+|\*)(?:\[@([\w-]+)=(['"])([^'"\n]*)\4\])?$""")
+
+# Fallos esperables al interactuar con un elemento (clic, escritura)
+_ERRORES_INTERACCION = (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+)
+
+# Archivo de selectores reparados compartido por todas las sesiones; ver SelectorCache
+_LOCATORS_PATH = Path.home() / ".ec_cc_selectors.json"
+
+# Valor de atributo que en safe_find_many indica "texto del elemento"
+TEXTO = "#text"
+
+# Traducción en el navegador de los métodos By (salvo XPath) a selectores CSS
+_JS_CSS_DE_BY = """
+const css = (by, v) => {
+  switch (by) {
+    case 'css selector': case 'tag name': return v;
+    case 'id': return '#' + CSS.escape(v);
+    case 'class name': return '.' + CSS.escape(v);
+    case 'name': return '[name="' + CSS.escape(v) + '"]';
+  }
+  return null;
+};
+"""
+
+# Resuelve en el navegador una lista de (by, value, atributo) en una sola llamada
+_JS_FIND_MANY = _JS_CSS_DE_BY + """
+const root = arguments[0] || document;
+const one = (by, v) => {
+  if (by === 'xpath') return document.evaluate(
+    v, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  const sel = css(by, v);
+  return sel === null ? null : root.querySelector(sel);
+};
+return arguments[1].map(([by, v, attr]) => {
+  const e = one(by, v);
+  if (!e) return null;
+  return attr === '#text' ? e.innerText.trim() : e.getAttribute(attr);
+});
+"""
+
+# Texto de todos los elementos que coinciden con (by, value) en una sola llamada
+_JS_TEXTOS = _JS_CSS_DE_BY + """
+const root = arguments[0] || document, by = arguments[1], v = arguments[2];
+let els = [];
+if (by === 'xpath') {
+  const r = document.evaluate(v, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  for (let i = 0; i < r.snapshotLength; i++) els.push(r.snapshotItem(i));
+} else {
+  els = Array.from(root.querySelectorAll(css(by, v)));
+}
+return els.map(e => e.innerText.trim());
+"""
+_BY_SOPORTADOS_JS = frozenset({
+    By.CSS_SELECTOR, By.ID, By.CLASS_NAME, By.NAME, By.TAG_NAME, By.XPATH,
+})
+
+# querySelectorAll cacheado en el navegador por selector. El script se instala solo en
+# cada documento nuevo y un MutationObserver vacía la caché ante cualquier cambio del DOM
+_JS_QSA_CACHED = """
+let cache = window.__ecSelCache;
+if (!cache) {
+  cache = window.__ecSelCache = new Map();
+  new MutationObserver(() => window.__ecSelCache.clear()).observe(
+    document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+const sel = arguments[0];
+let res = cache.get(sel);
+if (!res) {
+  res = Array.from(document.querySelectorAll(sel));
+  cache.set(sel, res);
+}
+return res;
+"""
+
+# Pool compartido para las variantes async (asafe_*), creado bajo demanda
+_ASYNC_WORKERS = 16
+_async_executor: Optional[ThreadPoolExecutor] = None
+_async_executor_lock = threading.Lock()
+
+# Intervalo de sondeo de las esperas (segundos); el de Selenium por defecto es 0.5
+_POLL_FREQUENCY = 0.05
+
+# Atributo del driver donde se guardan sus WebDriverWait reutilizables ({timeout: wait}).
+# Se guardan en el propio driver y no en un WeakKeyDictionary porque cada wait
+# referencia a su driver y lo mantendría vivo para siempre
+_WAITS_ATTR = "_ec_cc_waits"
+
+
+def _obtener_wait(driver, timeout: float) -> WebDriverWait:
+    """Retorna el WebDriverWait del driver para ese timeout, creándolo la primera vez."""
+    por_timeout: Optional[Dict[float, WebDriverWait]] = getattr(driver, _WAITS_ATTR, None)
+    if por_timeout is None:
+        por_timeout = {}
+        try:
+            setattr(driver, _WAITS_ATTR, por_timeout)
+        except AttributeError:
+            pass
+    wait = por_timeout.get(timeout)
+    if wait is None:
+        wait = por_timeout[timeout] = WebDriverWait(driver, timeout, poll_frequency=_POLL_FREQUENCY)
+    return wait
+
+
+@lru_cache(maxsize=2048)
+def _ec_presencia(by: By, value: str) -> Callable:
+    """Condición presence_of_element_located reutilizable por (by, value)."""
+    return EC.presence_of_element_located((by, value))
+
+
+@lru_cache(maxsize=2048)
+def _ec_clickeable(by: By, value: str) -> Callable:
+    """Condición element_to_be_clickable reutilizable por (by, value)."""
+    return EC.element_to_be_clickable((by, value))
+
+
+def _esperar_condicion(driver, condicion, timeout: int):
+    """
+    Espera una condición de expected_conditions con sondeo corto.
+    
+    Si el driver tiene implicit wait, lo suspende mientras sondea para que
+    ningún intento (tampoco el primero) quede bloqueado por él. WebDriverWait
+    evalúa la condición antes de la primera pausa, así que si el elemento ya
+    está retorna sin esperar.
+    
+    Args:
+        driver: Instancia de WebDriver
+        condicion: Callable de expected_conditions
+        timeout: Tiempo máximo de espera en segundos
+    
+    Returns:
+        Resultado de la condición
+    
+    Raises:
+        TimeoutException: Si la condición no se cumple dentro del timeout
+    """
+    implicit_wait = driver.timeouts.implicit_wait
+    if implicit_wait:
+        driver.implicitly_wait(0)
+    try:
+        return _obtener_wait(driver, timeout).until(condicion)
+    finally:
+        if implicit_wait:
+            driver.implicitly_wait(implicit_wait)
+
+
+def clear_element_cache() -> None:
+    """
+    Vacía la caché de elementos localizados.
+    
+    Los elementos que quedan obsoletos se detectan solos (StaleElementReferenceException),
+    pero tras navegar o recargar contenido dinámico conviene vaciarla explícitamente.
+    """
+    with _element_cache_lock:
+        for driver in list(_drivers_con_cache):
+            cache = getattr(driver, _ELEMENT_CACHE_ATTR, None)
+            if cache is not None:
+                cache.clear()
+
+
+@lru_cache(maxsize=1024)
+def _xpath_a_css(value: str, desde_documento: bool) -> Optional[str]:
+    """
+    Traduce un XPath simple a un selector CSS equivalente, o None si no es posible.
+    
+    Los atributos se comparan por igualdad exacta ([attr="v"]), como en XPath,
+    incluso id y class. Un XPath absoluto (//tag) solo equivale a CSS cuando se
+    busca desde el documento; desde un elemento solo se traduce .//tag.
+    """
+    m = _XPATH_SIMPLE_RE.match(value)
+    if not m:
+        return None
+    punto, tag, attr, _, valor = m.groups()
+    if not punto and not desde_documento:
+        return None
+    if not attr:
+        return tag
+    valor = valor.replace("\\", "\\\\")
+    return f'{tag}[{attr}="{valor}"]'
+
+
+def _preferir_css(parent, by: By, value: str) -> Tuple[str, str]:
+    """Retorna (By.CSS_SELECTOR, css) si (by, value) es un XPath simple traducible."""
+    if by != By.XPATH:
+        return by, value
+    css = _xpath_a_css(value, not isinstance(parent, (WebElement, CachedElement)))
+    return (By.CSS_SELECTOR, css) if css else (by, value)
+
+
+def _cache_elementos(parent) -> Optional[OrderedDict]:
+    """
+    Retorna la caché de elementos del driver al que pertenece parent, creándola
+    la primera vez, o None si el driver no admite guardarla.
+    """
+    # WebElement.parent es su driver; un driver no tiene atributo parent
+    driver = getattr(parent, "parent", None) or parent
+    cache = getattr(driver, _ELEMENT_CACHE_ATTR, None)
+    if cache is None:
+        with _element_cache_lock:
+            cache = getattr(driver, _ELEMENT_CACHE_ATTR, None)
+            if cache is None:
+                cache = OrderedDict()
+                try:
+                    _drivers_con_cache.add(driver)
+                    setattr(driver, _ELEMENT_CACHE_ATTR, cache)
+                except (AttributeError, TypeError):
+                    return None
+    return cache
+
+
+def _buscar_cacheado(parent, by: By, value: str) -> WebElement:
+    """
+    Retorna el elemento (by, value) dentro de parent, reutilizando búsquedas previas.
+    
+    Raises:
+        NoSuchElementException: Si el elemento no existe (los fallos no se cachean)
+    """
+    cache = _cache_elementos(parent)
+    clave = (id(parent), by, value)
+    if cache is not None:
+        with _element_cache_lock:
+            entrada = cache.get(clave)
+            if entrada is not None and entrada[0] is parent:
+                cache.move_to_end(clave)
+                return entrada[1]
+    
+    element = parent.find_element(*_preferir_css(parent, by, value))
+    if cache is not None:
+        with _element_cache_lock:
+            cache[clave] = (parent, element)
+            if len(cache) > _ELEMENT_CACHE_MAX:
+                cache.popitem(last=False)
+    return element
+
+
+def _leer_elemento(parent, by: By, value: str, lectura: Callable[[WebElement], Any]) -> Any:
+    """
+    Aplica lectura al elemento cacheado; si quedó obsoleto lo busca de nuevo una vez.
+    """
+    try:
+        return lectura(_buscar_cacheado(parent, by, value))
+    except StaleElementReferenceException:
+        cache = _cache_elementos(parent)
+        if cache is not None:
+            with _element_cache_lock:
+                cache.pop((id(parent), by, value), None)
+        return lectura(_buscar_cacheado(parent, by, value))
+
+
+class SelectorCache:
+    """
+    Selectores reparados (clave -> (by, value)) persistidos en un archivo JSON.
+    
+    El archivo se lee una sola vez por proceso (en el primer acceso) y se
+    reescribe de forma atómica con flush(), que se ejecuta al salir del proceso
+    si hubo cambios. Así todas las sesiones de Selenium parten de los selectores
+    que ya funcionaron en ejecuciones anteriores.
+    """
+    
+    def __init__(self, path: Path = _LOCATORS_PATH):
+        """
+        Args:
+            path: Archivo JSON donde se guardan los selectores
+        """
+        self.path = Path(path)
+        self._data: Optional[Dict[str, Tuple[str, str]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _cargar(self) -> Dict[str, Tuple[str, str]]:
+        """Retorna los selectores, leyendo el archivo la primera vez."""
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    try:
+                        with open(self.path, encoding="utf-8") as f:
+                            self._data = {clave: tuple(loc) for clave, loc in json.load(f).items()}
+                    except FileNotFoundError:
+                        self._data = {}
+                    except (OSError, ValueError, TypeError, AttributeError) as e:
+                        logger.warning("No se pudo leer %s: %s", self.path, e)
+                        self._data = {}
+        return self._data
+    
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        """Retorna el selector (by, value) guardado para key, o None."""
+        return self._cargar().get(key)
+    
+    def put(self, key: str, by: str, value: str) -> None:
+        """Guarda el selector (by, value) de key."""
+        data = self._cargar()
+        locator = (by, value)
+        with self._lock:
+            if data.get(key) != locator:
+                data[key] = locator
+                self._dirty = True
+    
+    def discard(self, key: str) -> None:
+        """Olvida el selector guardado para key, si existe."""
+        data = self._cargar()
+        with self._lock:
+            if data.pop(key, None) is not None:
+                self._dirty = True
+    
+    def flush(self) -> None:
+        """Escribe el archivo de forma atómica si hubo cambios desde la última escritura."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({c: list(loc) for c, loc in self._data.items()}, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning("No se pudo guardar %s: %s", self.path, e)
+
+
+# Instancia compartida por safe_find_text / safe_find_attribute (parámetro key)
+selector_cache = SelectorCache()
+atexit.register(selector_cache.flush)
+
+
+def _leer_con_respaldo(parent, by: By, value: str, lectura: Callable[[WebElement], Any],
+                       fallbacks: Optional[List[Tuple[By, str]]], key: Optional[str]) -> Any:
+    """
+    Como _leer_elemento, pero si (by, value) no existe prueba los selectores de
+    respaldo, empezando por el que funcionó la última vez (guardado en
+    selector_cache, también entre sesiones y ejecuciones). El selector
+    recordado solo se usa si está entre los respaldos de esta llamada.
+    
+    Raises:
+        NoSuchElementException: Si ningún selector encuentra el elemento
+    """
+    if not fallbacks:
+        return _leer_elemento(parent, by, value, lectura)
+    
+    clave = key or f"{by}:{value}"
+    principal = (by, value)
+    respaldos = [tuple(loc) for loc in fallbacks if tuple(loc) != principal]
+    recordado = selector_cache.get(clave)
+    if recordado in respaldos:
+        respaldos.remove(recordado)
+        respaldos.insert(0, recordado)
+    
+    for by_i, value_i in [principal] + respaldos:
+        try:
+            resultado = _leer_elemento(parent, by_i, value_i, lectura)
+        except NoSuchElementException:
+            continue
+        ganador = (by_i, value_i)
+        if ganador != principal and ganador != recordado:
+            logger.info("Selector reparado para '%s': %s=%s", clave, by_i, value_i)
+            selector_cache.put(clave, by_i, value_i)
+        return resultado
+    raise NoSuchElementException(f"Ningún selector encontró el elemento '{clave}'")
+
+
+def _texto_visible(element: WebElement) -> str:
+    """Texto renderizado del elemento (comando getText de WebDriver)."""
+    return element.text.strip()
+
+
+def _texto_crudo(element: WebElement) -> str:
+    """textContent del elemento, sin aplicar las reglas de visibilidad de getText."""
+    return (element.parent.execute_script("return arguments[0].textContent;", element) or "").strip()
+
+
+def safe_find_text(parent: WebElement, by: By, value: str, default: str = "",
+                   fallbacks: Optional[List[Tuple[By, str]]] = None,
+                   key: Optional[str] = None, raw: bool = False) -> str:
     """
     Busca texto de un elemento de forma segura.
     
@@ -23,22 +424,31 @@ def safe_find_text(parent: WebElement, by: By, value: str, default: str = "") ->
         by: Método de búsqueda (By.ID, By.CLASS_NAME, etc.)
         value: Valor a buscar
         default: Valor por defecto si no se encuentra
+        fallbacks: Selectores (by, value) alternativos si (by, value) no existe.
+            El que funcione se guarda en selector_cache y se prueba primero
+            en las siguientes llamadas (también en otras ejecuciones)
+        key: Clave con la que se recuerda el selector reparado (default: "by:value")
+        raw: Si True, retorna textContent (incluye texto oculto y no normaliza
+            espacios internos); el navegador no evalúa visibilidad, más rápido
     
     Returns:
         Texto encontrado o valor por defecto
     """
     try:
-        element = parent.find_element(by, value)
-        return element.text.strip()
+        return _leer_con_respaldo(
+            parent, by, value, _texto_crudo if raw else _texto_visible, fallbacks, key
+        )
     except (NoSuchElementException, AttributeError):
         return default
     except Exception as e:
-        logger.warning(f"Error al buscar texto: {e}")
+        logger.warning("Error al buscar texto: %s", e)
         return default
 
 
 def safe_find_attribute(parent: WebElement, by: By, value: str, 
-                        attribute: str, default: str = "") -> str:
+                        attribute: str, default: str = "",
+                        fallbacks: Optional[List[Tuple[By, str]]] = None,
+                        key: Optional[str] = None) -> str:
     """
     Busca atributo de un elemento de forma segura.
     
@@ -48,21 +458,129 @@ def safe_find_attribute(parent: WebElement, by: By, value: str,
         value: Valor a buscar
         attribute: Nombre del atributo a obtener
         default: Valor por defecto si no se encuentra
+        fallbacks: Selectores alternativos (ver safe_find_text)
+        key: Clave del selector reparado (ver safe_find_text)
     
     Returns:
         Valor del atributo o valor por defecto
     """
     try:
-        element = parent.find_element(by, value)
-        attr_value = element.get_attribute(attribute)
+        attr_value = _leer_con_respaldo(
+            parent, by, value, lambda element: element.get_attribute(attribute),
+            fallbacks, key,
+        )
         return attr_value if attr_value else default
     except (NoSuchElementException, AttributeError):
         return default
     except Exception as e:
-        logger.warning(f"Error al buscar atributo: {e}")
+        logger.warning("Error al buscar atributo: %s", e)
         return default
 
 
+def safe_find_many(driver, parent: Optional[WebElement],
+                   specs: List[Tuple[By, str, str]], default: str = "") -> List[str]:
+    """
+    Obtiene textos y atributos de varios elementos en un solo viaje al navegador.
+    
+    Equivale a varias llamadas a safe_find_text / safe_find_attribute, pero
+    resueltas con un único execute_script.
+    
+    Args:
+        driver: Instancia de WebDriver
+        parent: Elemento padre donde buscar (WebElement o CachedElement; None para
+            todo el documento)
+        specs: Lista de (by, value, atributo); atributo TEXTO ("#text") para el texto.
+            Soporta By.CSS_SELECTOR, By.ID, By.CLASS_NAME, By.NAME, By.TAG_NAME y By.XPATH
+        default: Valor por defecto si un elemento o atributo no existe
+    
+    Returns:
+        Lista de valores en el mismo orden que specs. Los atributos se leen con
+        getAttribute (atributo HTML, no propiedad DOM)
+    
+    Example:
+        nombre, enlace = safe_find_many(driver, fila, [
+            (By.CLASS_NAME, "nombre", TEXTO),
+            (By.CSS_SELECTOR, "a", "href"),
+        ])
+    """
+    no_soportados = [by for by, _, _ in specs if by not in _BY_SOPORTADOS_JS]
+    if no_soportados:
+        raise ValueError(f"Métodos de búsqueda no soportados en safe_find_many: {no_soportados}")
+    if isinstance(parent, CachedElement):
+        parent = parent.wrapped  # execute_script solo serializa WebElement
+    try:
+        valores = driver.execute_script(_JS_FIND_MANY, parent, [list(spec) for spec in specs])
+        return [default if not v else v for v in valores]
+    except Exception as e:
+        logger.warning("Error al buscar elementos en lote: %s", e)
+        return [default] * len(specs)
+
+
+_SIN_VALOR = object()
+
+
+class CachedElement:
+    """
+    Envoltura de un WebElement que memoriza sus lecturas de texto y atributos.
+    
+    Pensada para elementos que solo se leen (scraping): la primera lectura va al
+    navegador y las siguientes se sirven de memoria. El resto de atributos y
+    métodos (click, find_element, ...) se delegan al elemento original.
+    Para pasarlo a execute_script usar .wrapped.
+    """
+    
+    __slots__ = ("wrapped", "_cache")
+    
+    def __init__(self, element: WebElement):
+        """
+        Args:
+            element: WebElement a envolver
+        """
+        self.wrapped = element
+        self._cache = {}
+    
+    @property
+    def text(self) -> str:
+        """Texto del elemento (leído una sola vez)."""
+        valor = self._cache.get("text", _SIN_VALOR)
+        if valor is _SIN_VALOR:
+            valor = self._cache["text"] = self.wrapped.text
+        return valor
+    
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Valor del atributo name (leído una sola vez)."""
+        clave = ("attr", name)
+        valor = self._cache.get(clave, _SIN_VALOR)
+        if valor is _SIN_VALOR:
+            valor = self._cache[clave] = self.wrapped.get_attribute(name)
+        return valor
+    
+    def invalidate(self) -> None:
+        """Descarta las lecturas memorizadas (p. ej. tras interactuar con el elemento)."""
+        self._cache.clear()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+
+def cached_element(element: WebElement) -> CachedElement:
+    """
+    Envuelve un elemento para que sus lecturas de texto y atributos se memoricen.
+    
+    Args:
+        element: WebElement a envolver
+    
+    Returns:
+        CachedElement sobre element (el mismo objeto si ya estaba envuelto)
+    
+    Example:
+        fila = cached_element(fila)
+        nombre = fila.text
+        enlace = fila.get_attribute("href")
+    """
+    return element if isinstance(element, CachedElement) else CachedElement(element)
+
+
 def safe_find_elements(parent: WebElement, by: By, value: str) -> List[WebElement]:
     """
     Busca múltiples elementos de forma segura.
@@ -74,11 +592,72 @@ def safe_find_elements(parent: WebElement, by: By, value: str) -> List[WebElemen
     
     Returns:
         Lista de elementos encontrados (vacía si no hay)
+    
+    Note:
+        Si parent es el driver y by es By.CSS_SELECTOR, la consulta se resuelve
+        con una caché en el navegador que se invalida ante cambios del DOM.
+        Los selectores con pseudo-clases (:checked, :focus, ...) no se cachean:
+        su resultado cambia con el estado de los elementos sin mutar el DOM.
     """
     try:
+        by, value = _preferir_css(parent, by, value)
+        if (by == By.CSS_SELECTOR and ":" not in value
+                and not isinstance(parent, (WebElement, CachedElement))):
+            try:
+                return parent.execute_script(_JS_QSA_CACHED, value)
+            except Exception as e:
+                logger.debug("Caché de selectores no disponible, usando find_elements: %s", e)
         return parent.find_elements(by, value)
     except Exception as e:
-        logger.warning(f"Error al buscar elementos: {e}")
+        logger.warning("Error al buscar elementos: %s", e)
+        return []
+
+
+def safe_iter_elements(parent: WebElement, by: By, value: str) -> Iterator[CachedElement]:
+    """
+    Recorre los elementos encontrados envueltos en CachedElement.
+    
+    La búsqueda es un solo comando; el texto y los atributos de cada elemento se
+    leen solo si el llamador los usa (y una sola vez), así que cortar el recorrido
+    antes de tiempo evita el trabajo con el resto.
+    
+    Args:
+        parent: Elemento padre donde buscar
+        by: Método de búsqueda
+        value: Valor a buscar
+    
+    Yields:
+        CachedElement por cada elemento encontrado
+    """
+    for element in safe_find_elements(parent, by, value):
+        yield cached_element(element)
+
+
+def safe_texts(driver, parent: Optional[WebElement], by: By, value: str) -> List[str]:
+    """
+    Obtiene el texto de todos los elementos que coinciden, en un solo viaje al navegador.
+    
+    Equivale a [e.text.strip() for e in safe_find_elements(...)] sin el comando
+    getText por elemento.
+    
+    Args:
+        driver: Instancia de WebDriver
+        parent: Elemento padre donde buscar (WebElement o CachedElement; None para
+            todo el documento)
+        by: Método de búsqueda (mismos soportados que safe_find_many)
+        value: Valor a buscar
+    
+    Returns:
+        Lista de textos (vacía si no hay coincidencias o hubo error)
+    """
+    if by not in _BY_SOPORTADOS_JS:
+        raise ValueError(f"Método de búsqueda no soportado en safe_texts: {by}")
+    if isinstance(parent, CachedElement):
+        parent = parent.wrapped  # execute_script solo serializa WebElement
+    try:
+        return driver.execute_script(_JS_TEXTOS, parent, by, value)
+    except Exception as e:
+        logger.warning("Error al obtener textos: %s", e)
         return []
 
 
@@ -96,13 +675,12 @@ def wait_for_element(driver, by: By, value: str, timeout: int = 10) -> Optional[
         Elemento encontrado o None
     """
     try:
-        wait = WebDriverWait(driver, timeout)
-        return wait.until(EC.presence_of_element_located((by, value)))
+        return _esperar_condicion(driver, _ec_presencia(*_preferir_css(driver, by, value)), timeout)
     except TimeoutException:
-        logger.warning(f"Timeout esperando elemento: {value}")
+        logger.warning("Timeout esperando elemento: %s", value)
         return None
     except Exception as e:
-        logger.warning(f"Error esperando elemento: {e}")
+        logger.warning("Error esperando elemento: %s", e)
         return None
 
 
@@ -120,13 +698,12 @@ def wait_for_clickable(driver, by: By, value: str, timeout: int = 10) -> Optiona
         Elemento encontrado o None
     """
     try:
-        wait = WebDriverWait(driver, timeout)
-        return wait.until(EC.element_to_be_clickable((by, value)))
+        return _esperar_condicion(driver, _ec_clickeable(*_preferir_css(driver, by, value)), timeout)
     except TimeoutException:
-        logger.warning(f"Timeout esperando elemento clickeable: {value}")
+        logger.warning("Timeout esperando elemento clickeable: %s", value)
         return None
     except Exception as e:
-        logger.warning(f"Error esperando elemento clickeable: {e}")
+        logger.warning("Error esperando elemento clickeable: %s", e)
         return None
 
 
@@ -143,8 +720,11 @@ def safe_click(element: WebElement) -> bool:
     try:
         element.click()
         return True
+    except _ERRORES_INTERACCION as e:
+        logger.warning("No se pudo hacer clic (%s): %s", type(e).__name__, e)
+        return False
     except Exception as e:
-        logger.warning(f"Error al hacer clic: {e}")
+        logger.warning("Error al hacer clic: %s", e)
         return False
 
 
@@ -165,7 +745,85 @@ def safe_send_keys(element: WebElement, text: str, clear_first: bool = True) ->
             element.clear()
         element.send_keys(text)
         return True
+    except _ERRORES_INTERACCION as e:
+        logger.warning("No se pudo enviar texto (%s): %s", type(e).__name__, e)
+        return False
     except Exception as e:
-        logger.warning(f"Error al enviar texto: {e}")
+        logger.warning("Error al enviar texto: %s", e)
         return False
 
+
+# ---------------------------------------------------------------------------
+# Variantes async: ejecutan los helpers síncronos en un pool de hilos para no
+# bloquear el event loop. Para limitar la concurrencia contra un mismo sitio,
+# envolver las llamadas en un asyncio.Semaphore propio, por ejemplo:
+#
+#     limite = asyncio.Semaphore(4)
+#     async def leer(fila):
+#         async with limite:
+#             return await asafe_find_text(fila, By.CLASS_NAME, "nombre")
+# ---------------------------------------------------------------------------
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    """Retorna el pool compartido para las variantes async (creado bajo demanda)."""
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(
+                max_workers=_ASYNC_WORKERS, thread_name_prefix="WebHelpers"
+            )
+    return _async_executor
+
+
+async def _en_hilo(func: Callable, *args: Any) -> Any:
+    """Ejecuta func(*args) en el pool compartido y espera su resultado."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_async_executor(), func, *args)
+
+
+async def asafe_find_text(parent: WebElement, by: By, value: str, default: str = "",
+                          fallbacks: Optional[List[Tuple[By, str]]] = None,
+                          key: Optional[str] = None, raw: bool = False) -> str:
+    """Versión async de safe_find_text."""
+    return await _en_hilo(safe_find_text, parent, by, value, default, fallbacks, key, raw)
+
+
+async def asafe_find_attribute(parent: WebElement, by: By, value: str,
+                               attribute: str, default: str = "",
+                               fallbacks: Optional[List[Tuple[By, str]]] = None,
+                               key: Optional[str] = None) -> str:
+    """Versión async de safe_find_attribute."""
+    return await _en_hilo(
+        safe_find_attribute, parent, by, value, attribute, default, fallbacks, key
+    )
+
+
+async def asafe_find_many(driver, parent: Optional[WebElement],
+                          specs: List[Tuple[By, str, str]], default: str = "") -> List[str]:
+    """Versión async de safe_find_many."""
+    return await _en_hilo(safe_find_many, driver, parent, specs, default)
+
+
+async def asafe_find_elements(parent: WebElement, by: By, value: str) -> List[WebElement]:
+    """Versión async de safe_find_elements."""
+    return await _en_hilo(safe_find_elements, parent, by, value)
+
+
+async def await_for_element(driver, by: By, value: str, timeout: int = 10) -> Optional[WebElement]:
+    """Versión async de wait_for_element."""
+    return await _en_hilo(wait_for_element, driver, by, value, timeout)
+
+
+async def await_for_clickable(driver, by: By, value: str, timeout: int = 10) -> Optional[WebElement]:
+    """Versión async de wait_for_clickable."""
+    return await _en_hilo(wait_for_clickable, driver, by, value, timeout)
+
+
+async def asafe_click(element: WebElement) -> bool:
+    """Versión async de safe_click."""
+    return await _en_hilo(safe_click, element)
+
+
+async def asafe_send_keys(element: WebElement, text: str, clear_first: bool = True) -> bool:
+    """Versión async de safe_send_keys."""
+    return await _en_hilo(safe_send_keys, element, text, clear_first)